@@ -0,0 +1,43 @@
+"""add name/description trigram indexes
+
+Revision ID: 0a7c5e82d4f1
+Revises: f82d4a6c13b9
+Create Date: 2026-01-16 09:41:55.730218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7c5e82d4f1'
+down_revision: Union[str, None] = 'f82d4a6c13b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Complete the trigram coverage started with the category/brand/retailer
+    # indexes: the product service still issues contains-ILIKE filters on
+    # name and description, and these indexes also back the pg_trgm %
+    # similarity operator used for fuzzy name matching. PostgreSQL only.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_products_name_trgm ON products "
+        "USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_products_description_trgm ON products "
+        "USING gin (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_products_description_trgm")
+    op.execute("DROP INDEX ix_products_name_trgm")
@@ -0,0 +1,37 @@
+"""add partial in-stock product probe index
+
+Revision ID: 1b9e6d43f0a8
+Revises: 0a7c5e82d4f1
+Create Date: 2026-01-19 13:26:40.195782
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b9e6d43f0a8'
+down_revision: Union[str, None] = '0a7c5e82d4f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The in-stock EXISTS probes look up prices by product_id among in-stock
+    # rows only; a partial index keyed on product_id answers each probe with
+    # a single descent and never indexes out-of-stock rows. Complements
+    # ix_prices_instock_price, which leads on price for the deals ordering.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_prices_instock_product ON prices (product_id) "
+        "WHERE in_stock"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_prices_instock_product")
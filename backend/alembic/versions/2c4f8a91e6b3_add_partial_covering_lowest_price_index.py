@@ -0,0 +1,48 @@
+"""add partial covering lowest-price index
+
+Revision ID: 2c4f8a91e6b3
+Revises: 1b9e6d43f0a8
+Create Date: 2026-02-02 09:41:17.508264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c4f8a91e6b3'
+down_revision: Union[str, None] = '1b9e6d43f0a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_lowest_price runs WHERE product_id = :id AND in_stock
+    # ORDER BY price LIMIT 1. A partial (product_id, price) index answers
+    # that with a single descent to the cheapest in-stock row — no sort —
+    # and the INCLUDE payload lets PG return retailer/url/currency from an
+    # index-only scan without touching the heap. Verify with EXPLAIN: the
+    # plan should read "Limit -> Index Only Scan using
+    # ix_prices_prod_price_instock".
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_prices_prod_price_instock ON prices "
+        "(product_id, price) INCLUDE (retailer, url, currency) "
+        "WHERE in_stock"
+    )
+    # Its leftmost prefix now serves the product_id probes that
+    # ix_prices_instock_product (same partial predicate) was added for.
+    op.execute("DROP INDEX ix_prices_instock_product")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_prices_instock_product ON prices (product_id) "
+        "WHERE in_stock"
+    )
+    op.execute("DROP INDEX ix_prices_prod_price_instock")
@@ -0,0 +1,50 @@
+"""add category/brand pagination indexes
+
+Revision ID: 3f9b5d27c8e4
+Revises: 2c4f8a91e6b3
+Create Date: 2026-02-09 10:27:33.614892
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9b5d27c8e4'
+down_revision: Union[str, None] = '2c4f8a91e6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # List pages filter on category or brand and paginate by id; leading on
+    # the filter column with id second returns each page in index order with
+    # no sort. The INCLUDE payload (PostgreSQL only, ignored elsewhere)
+    # covers the summary select for index-only scans.
+    op.create_index(
+        'ix_products_category_id',
+        'products',
+        ['category', 'id'],
+        postgresql_include=['name', 'brand'],
+    )
+    op.create_index(
+        'ix_products_brand_id',
+        'products',
+        ['brand', 'id'],
+        postgresql_include=['name', 'category'],
+    )
+    # The category composite's leftmost prefix replaces the single-column
+    # index. IF EXISTS for databases bootstrapped after index=True was
+    # dropped from the model.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS ix_products_category')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_products_category', 'products', ['category'])
+    op.drop_index('ix_products_brand_id', table_name='products')
+    op.drop_index('ix_products_category_id', table_name='products')
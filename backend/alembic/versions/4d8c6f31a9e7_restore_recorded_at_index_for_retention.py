@@ -0,0 +1,38 @@
+"""restore recorded_at index for retention cleanup
+
+Revision ID: 4d8c6f31a9e7
+Revises: 3f9b5d27c8e4
+Create Date: 2026-02-16 08:54:09.377251
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8c6f31a9e7'
+down_revision: Union[str, None] = '3f9b5d27c8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The redundant-index sweep dropped ix_price_history_recorded_at on the
+    # grounds that recorded_at is always queried with product_id — which
+    # overlooked the nightly retention DELETE, whose bare recorded_at cutoff
+    # the product_id-leading composites cannot serve. Restore it so the
+    # cleanup batches are index range scans. PostgreSQL only: the drop was
+    # PostgreSQL-gated, so other backends still have the original index.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index(
+        'ix_price_history_recorded_at', 'price_history', ['recorded_at']
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_price_history_recorded_at', table_name='price_history')
@@ -0,0 +1,38 @@
+"""add price history daily rollup table
+
+Revision ID: 4e91ab07d3f6
+Revises: c8f20d1b64e7
+Create Date: 2025-12-17 11:23:40.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e91ab07d3f6'
+down_revision: Union[str, None] = 'c8f20d1b64e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('price_history_daily',
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('retailer', sa.String(), nullable=False),
+    sa.Column('min_price', sa.Float(), nullable=False),
+    sa.Column('max_price', sa.Float(), nullable=False),
+    sa.Column('avg_price', sa.Float(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('first_price', sa.Float(), nullable=False),
+    sa.Column('last_price', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('product_id', 'day', 'retailer')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('price_history_daily')
@@ -0,0 +1,31 @@
+"""add price history composite index
+
+Revision ID: 7b3c41e9a5d2
+Revises: 02119598734c
+Create Date: 2025-12-15 10:04:52.330127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3c41e9a5d2'
+down_revision: Union[str, None] = '02119598734c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_price_history_product_recorded',
+        'price_history',
+        ['product_id', sa.text('recorded_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_price_history_product_recorded', table_name='price_history')
@@ -0,0 +1,37 @@
+"""add lower name functional index
+
+Revision ID: 9d5e72c0a1b8
+Revises: 4e91ab07d3f6
+Create Date: 2025-12-18 14:52:06.774911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d5e72c0a1b8'
+down_revision: Union[str, None] = '4e91ab07d3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # text_pattern_ops so the index serves LIKE 'prefix%' regardless of
+        # the database collation.
+        op.execute(
+            "CREATE INDEX ix_products_name_lower ON products "
+            "(lower(name) text_pattern_ops)"
+        )
+    else:
+        op.create_index(
+            'ix_products_name_lower', 'products', [sa.text('lower(name)')],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_name_lower', table_name='products')
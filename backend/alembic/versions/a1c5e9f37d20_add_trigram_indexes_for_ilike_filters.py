@@ -0,0 +1,47 @@
+"""add trigram indexes for ilike filters
+
+Revision ID: a1c5e9f37d20
+Revises: f3a9d84c57be
+Create Date: 2025-12-19 14:05:31.284917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c5e9f37d20'
+down_revision: Union[str, None] = 'f3a9d84c57be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes let the planner serve the contains-ILIKE filters on
+    # category/brand/retailer from posting lists instead of full scans.
+    # PostgreSQL only (pg_trgm extension); SQLite in tests keeps scanning.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_products_category_trgm ON products "
+        "USING gin (category gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_products_brand_trgm ON products "
+        "USING gin (brand gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_prices_retailer_trgm ON prices "
+        "USING gin (retailer gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_prices_retailer_trgm")
+    op.execute("DROP INDEX ix_products_brand_trgm")
+    op.execute("DROP INDEX ix_products_category_trgm")
@@ -0,0 +1,47 @@
+"""add covering price history indexes
+
+Revision ID: b6d210f84e3c
+Revises: a1c5e9f37d20
+Create Date: 2025-12-20 09:18:54.730266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d210f84e3c'
+down_revision: Union[str, None] = 'a1c5e9f37d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rebuild the (product_id, recorded_at DESC) index with INCLUDE columns
+    # so the history endpoints run as index-only scans with presorted output,
+    # and add a retailer-leading variant for retailer-filtered windows.
+    # INCLUDE is PostgreSQL-only; SQLite keeps the plain composite index.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_price_history_product_recorded")
+    op.execute(
+        "CREATE INDEX ix_price_history_product_recorded ON price_history "
+        "(product_id, recorded_at DESC) INCLUDE (price, retailer, currency)"
+    )
+    op.execute(
+        "CREATE INDEX ix_price_history_product_retailer_recorded ON price_history "
+        "(product_id, retailer, recorded_at DESC) INCLUDE (price)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_price_history_product_retailer_recorded")
+    op.execute("DROP INDEX ix_price_history_product_recorded")
+    op.execute(
+        "CREATE INDEX ix_price_history_product_recorded ON price_history "
+        "(product_id, recorded_at DESC)"
+    )
@@ -0,0 +1,37 @@
+"""add product fulltext search index
+
+Revision ID: c8f20d1b64e7
+Revises: 7b3c41e9a5d2
+Create Date: 2025-12-16 09:41:17.502846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f20d1b64e7'
+down_revision: Union[str, None] = '7b3c41e9a5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression GIN index backing product_text_search_clause; PostgreSQL only,
+    # other backends (SQLite in tests) fall back to ILIKE without the index.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_products_search_tsv ON products USING gin ("
+        "to_tsvector('english', coalesce(name,'') || ' ' || "
+        "coalesce(description,'') || ' ' || coalesce(brand,''))"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_products_search_tsv")
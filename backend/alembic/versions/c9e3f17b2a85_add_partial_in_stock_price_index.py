@@ -0,0 +1,37 @@
+"""add partial in_stock price index
+
+Revision ID: c9e3f17b2a85
+Revises: b6d210f84e3c
+Create Date: 2025-12-20 15:47:12.609433
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e3f17b2a85'
+down_revision: Union[str, None] = 'b6d210f84e3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # search_deals always filters in_stock and orders by price; a partial
+    # index on (price) WHERE in_stock gives it a pre-filtered, presorted
+    # scan with LIMIT pushdown and never touches out-of-stock rows.
+    # INCLUDE is PostgreSQL-only, so other backends are skipped.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "CREATE INDEX ix_prices_instock_price ON prices (price ASC) "
+        "INCLUDE (product_id, retailer) WHERE in_stock"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_prices_instock_price")
@@ -0,0 +1,50 @@
+"""use server-side timestamp defaults
+
+Revision ID: d4f8b26a91c7
+Revises: c9e3f17b2a85
+Create Date: 2026-01-06 10:22:48.173920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f8b26a91c7'
+down_revision: Union[str, None] = 'c9e3f17b2a85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns that previously relied on a Python-side
+# default=lambda: datetime.now(timezone.utc). Moving the default into the
+# schema lets bulk/Core INSERTs omit the column and keeps the database
+# clock authoritative across workers.
+_COLUMNS = [
+    ('products', 'created_at'),
+    ('products', 'updated_at'),
+    ('prices', 'scraped_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('wishlist_items', 'created_at'),
+    ('price_history', 'recorded_at'),
+    ('retailers', 'created_at'),
+    ('retailers', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    # SQLite cannot ALTER a column's default in place; its databases are
+    # created via create_all and pick the default up from the model.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=None)
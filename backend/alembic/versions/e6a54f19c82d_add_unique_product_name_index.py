@@ -0,0 +1,32 @@
+"""add unique product name index
+
+Revision ID: e6a54f19c82d
+Revises: 9d5e72c0a1b8
+Create Date: 2025-12-19 09:15:33.602158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a54f19c82d'
+down_revision: Union[str, None] = '9d5e72c0a1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('uq_products_name', 'products', ['name'], unique=True)
+    # The unique index fully subsumes the plain single-column one; keeping
+    # both would cost a second B-tree descent per product write. IF EXISTS
+    # because databases bootstrapped via create_all after the model-side
+    # index=True flag was removed never had it.
+    op.execute('DROP INDEX IF EXISTS ix_products_name')
+
+
+def downgrade() -> None:
+    op.create_index('ix_products_name', 'products', ['name'])
+    op.drop_index('uq_products_name', table_name='products')
@@ -0,0 +1,44 @@
+"""add price and wishlist composite indexes
+
+Revision ID: e7b3c95d24af
+Revises: d4f8b26a91c7
+Create Date: 2026-01-09 09:14:31.820547
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c95d24af'
+down_revision: Union[str, None] = 'd4f8b26a91c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite indexes matching the actual query shapes: price lookups
+    # filter by product and either retailer or price order, wishlist rows
+    # are addressed by (user, product). The unique wishlist index also
+    # enforces one row per user/product pair, which the add route only
+    # checked application-side before.
+    op.create_index(
+        'ix_prices_product_retailer', 'prices', ['product_id', 'retailer']
+    )
+    op.create_index(
+        'ix_prices_product_price', 'prices', ['product_id', 'price']
+    )
+    op.create_index(
+        'ix_wishlist_user_product',
+        'wishlist_items',
+        ['user_id', 'product_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wishlist_user_product', table_name='wishlist_items')
+    op.drop_index('ix_prices_product_price', table_name='prices')
+    op.drop_index('ix_prices_product_retailer', table_name='prices')
@@ -0,0 +1,59 @@
+"""add stored search_tsv column
+
+Revision ID: f3a9d84c57be
+Revises: e6a54f19c82d
+Create Date: 2025-12-19 10:22:43.118752
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d84c57be'
+down_revision: Union[str, None] = 'e6a54f19c82d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replace the expression GIN index with a stored, weighted tsvector column
+    # so matches rank name over brand over description and the vector is not
+    # recomputed per row at query time. PostgreSQL only; other backends
+    # (SQLite in tests) keep the ILIKE fallback.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_products_search_tsv")
+    # The generated column is populated during the ALTER TABLE rewrite, so no
+    # row-by-row backfill UPDATE is needed afterwards.
+    op.execute(
+        "ALTER TABLE products ADD COLUMN search_tsv tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(name,'')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(brand,'')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description,'')), 'C')"
+        ") STORED"
+    )
+    # Build the GIN index outside the migration transaction and with more
+    # sort memory, so a large catalog neither blocks writes nor spills.
+    op.execute("SET maintenance_work_mem = '2GB'")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_products_search_tsv "
+            "ON products USING gin (search_tsv)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX ix_products_search_tsv")
+    op.execute("ALTER TABLE products DROP COLUMN search_tsv")
+    op.execute(
+        "CREATE INDEX ix_products_search_tsv ON products USING gin ("
+        "to_tsvector('english', coalesce(name,'') || ' ' || "
+        "coalesce(description,'') || ' ' || coalesce(brand,''))"
+        ")"
+    )
@@ -0,0 +1,56 @@
+"""drop redundant single-column indexes
+
+Revision ID: f82d4a6c13b9
+Revises: e7b3c95d24af
+Create Date: 2026-01-14 11:03:27.481265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f82d4a6c13b9'
+down_revision: Union[str, None] = 'e7b3c95d24af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes whose column is the leftmost prefix of one of the
+# composite indexes added earlier (or, for recorded_at, only ever queried
+# together with product_id). Each one still costs a B-tree descent per
+# scraper INSERT and buffer-cache space, for no query the composites do not
+# already serve. Retailer ILIKE scans are covered by the trigram indexes.
+_INDEXES = [
+    ('prices', 'ix_prices_product_id'),
+    ('prices', 'ix_prices_retailer'),
+    ('price_history', 'ix_price_history_product_id'),
+    ('price_history', 'ix_price_history_retailer'),
+    ('price_history', 'ix_price_history_recorded_at'),
+    ('wishlist_items', 'ix_wishlist_items_user_id'),
+]
+
+
+def upgrade() -> None:
+    # IF EXISTS because databases bootstrapped via create_all after the
+    # model-side index=True flags were removed never had these.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for _table, index in _INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index}')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    columns = {
+        'ix_prices_product_id': ('prices', 'product_id'),
+        'ix_prices_retailer': ('prices', 'retailer'),
+        'ix_price_history_product_id': ('price_history', 'product_id'),
+        'ix_price_history_retailer': ('price_history', 'retailer'),
+        'ix_price_history_recorded_at': ('price_history', 'recorded_at'),
+        'ix_wishlist_items_user_id': ('wishlist_items', 'user_id'),
+    }
+    for index, (table, column) in columns.items():
+        op.create_index(index, table, [column])
@@ -3,10 +3,11 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
+from app.core.cache import cached, clear_cache_pattern
 from app.db.database import get_db
 from app.models.user import User
 from app.models.wishlist import WishlistItem
@@ -30,6 +31,8 @@ def get_price_alerts(
     Returns:
         List of wishlist items with active price alerts
     """
+    # WishlistItemResponse never serializes the product relationship, so no
+    # eager load here — it would just be an extra query per request.
     alerts = (
         db.query(WishlistItem)
         .filter(
@@ -83,6 +86,9 @@ def set_price_alert(
     db.commit()
     db.refresh(wishlist_item)
 
+    # Drop any cached status for this user's alerts
+    clear_cache_pattern(f"get_alert_status:{current_user.id}:*")
+
     return wishlist_item
 
 
@@ -123,10 +129,21 @@ def remove_price_alert(
     wishlist_item.target_price = None
     db.commit()
 
+    # Drop any cached status for this user's alerts
+    clear_cache_pattern(f"get_alert_status:{current_user.id}:*")
+
     return {"message": "Price alert removed successfully"}
 
 
 @router.get("/{wishlist_item_id}/status", response_model=dict)
+@cached(
+    ttl_seconds=30,
+    # Key on the user as well as the item so results are never shared
+    # across users.
+    key_builder=lambda *args, **kwargs: (
+        f"{kwargs['current_user'].id}:{kwargs['wishlist_item_id']}"
+    ),
+)
 def get_alert_status(
     wishlist_item_id: int,
     current_user: User = Depends(get_current_active_user),
@@ -143,9 +160,17 @@ def get_alert_status(
     """
     from app.models.product import Price
 
-    # Verify wishlist item exists and belongs to user
-    wishlist_item = (
-        db.query(WishlistItem)
+    # Fetch the wishlist item and the product's lowest price in one round-trip
+    # by attaching the MIN(price) as a correlated scalar subquery.
+    lowest_price_subq = (
+        select(func.min(Price.price))
+        .where(Price.product_id == WishlistItem.product_id)
+        .correlate(WishlistItem)
+        .scalar_subquery()
+    )
+
+    row = (
+        db.query(WishlistItem, lowest_price_subq.label("lowest_price"))
         .filter(
             and_(
                 WishlistItem.id == wishlist_item_id,
@@ -155,28 +180,20 @@ def get_alert_status(
         .first()
     )
 
-    if not wishlist_item:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wishlist item not found",
         )
 
+    wishlist_item, lowest_price = row
+
     if wishlist_item.target_price is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No price alert set for this item",
         )
 
-    # Get lowest current price
-    lowest_price_record = (
-        db.query(Price)
-        .filter(Price.product_id == wishlist_item.product_id)
-        .order_by(Price.price.asc())
-        .first()
-    )
-
-    lowest_price = lowest_price_record.price if lowest_price_record else None
-
     # Determine if alert is triggered
     alert_triggered = (
         lowest_price is not None and lowest_price <= wishlist_item.target_price
@@ -3,23 +3,34 @@
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, case, func, desc, select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
+from app.api.routing import TrustedDataAPIRoute
 from app.db.database import get_db
-from app.models.price_history import PriceHistory
+from app.models.price_history import PriceHistory, PriceHistoryDaily
 from app.models.product import Price, Product
 from app.models.user import User
 from app.schemas.price_history import (
-    PriceHistoryChartData,
+    PRICE_HISTORY_LIST_ADAPTER,
     PriceHistoryChartResponse,
     PriceHistoryResponse,
     PriceHistoryStats,
 )
-
-router = APIRouter(prefix="/price-history", tags=["price-history"])
+from app.services.price_history import recorded_since_clause
+from app.services.product import product_exists
+
+router = APIRouter(
+    prefix="/price-history",
+    tags=["price-history"],
+    # Handlers here return rows pulled straight from the DB, so skip the
+    # redundant response-model re-validation pass and serialize with orjson.
+    route_class=TrustedDataAPIRoute,
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get(
@@ -42,29 +53,51 @@ def get_product_price_history(
     Returns:
         List of price history entries
     """
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
-
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-
-    query = db.query(PriceHistory).filter(
+    # Select only the response columns and stream them in batches instead of
+    # materializing full ORM objects for every row in the window. The cutoff
+    # is computed database-side where the dialect supports it.
+    query = select(
+        PriceHistory.id,
+        PriceHistory.product_id,
+        PriceHistory.retailer,
+        PriceHistory.price,
+        PriceHistory.currency,
+        PriceHistory.recorded_at,
+    ).where(
         and_(
             PriceHistory.product_id == product_id,
-            PriceHistory.recorded_at >= cutoff_date,
+            recorded_since_clause(db, days),
         )
     )
 
     if retailer:
-        query = query.filter(PriceHistory.retailer == retailer)
+        query = query.where(PriceHistory.retailer == retailer)
 
-    history = query.order_by(desc(PriceHistory.recorded_at)).all()
+    rows = db.execute(
+        query.order_by(desc(PriceHistory.recorded_at)).execution_options(
+            yield_per=1000
+        )
+    )
+
+    results = [dict(row) for row in rows.mappings()]
+
+    # Any history row proves the product exists; only spend the extra
+    # round-trip distinguishing "unknown product" from "no history" when the
+    # window came back empty.
+    if not results and not product_exists(db, product_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
 
-    return history
+    # Precompiled adapter turns the whole window into JSON bytes in one
+    # native pass, skipping jsonable_encoder's per-row datetime handling.
+    return Response(
+        PRICE_HISTORY_LIST_ADAPTER.dump_json(
+            PRICE_HISTORY_LIST_ADAPTER.validate_python(results)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -85,46 +118,68 @@ def get_price_history_chart_data(
     Returns:
         Chart data with timestamps and prices grouped by retailer
     """
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
+    # The product name is part of the payload, so the existence check comes
+    # for free; fetch just the name rather than the full ORM row.
+    product_name = db.query(Product.name).filter(Product.id == product_id).scalar()
+    if product_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+    retailers_data = {}
 
-    # Get all price history for the product
-    history = (
-        db.query(PriceHistory)
-        .filter(
-            and_(
-                PriceHistory.product_id == product_id,
-                PriceHistory.recorded_at >= cutoff_date,
+    # Wide windows resample from the nightly rollup: one point per (day,
+    # retailer) instead of every raw entry, so a cold 365-day chart reads
+    # hundreds of rows rather than thousands. Short windows keep raw points
+    # for intra-day resolution.
+    if days > 7:
+        cutoff_day = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+        rows = db.execute(
+            select(
+                PriceHistoryDaily.retailer,
+                PriceHistoryDaily.day,
+                PriceHistoryDaily.avg_price,
             )
+            .where(
+                and_(
+                    PriceHistoryDaily.product_id == product_id,
+                    PriceHistoryDaily.day >= cutoff_day,
+                )
+            )
+            .order_by(PriceHistoryDaily.day)
         )
-        .order_by(PriceHistory.recorded_at)
-        .all()
-    )
+        for retailer, day, price in rows:
+            retailers_data.setdefault(retailer, []).append(
+                {"timestamp": day, "price": price}
+            )
 
-    # Group by retailer and create chart data
-    retailers_data = {}
-    for entry in history:
-        if entry.retailer not in retailers_data:
-            retailers_data[entry.retailer] = []
-
-        retailers_data[entry.retailer].append(
-            PriceHistoryChartData(
-                timestamp=entry.recorded_at,
-                price=entry.price,
+    # Bulk column fetch grouped into plain dicts: a chart window can be
+    # thousands of points, and orjson serializes the dicts (datetimes
+    # included) without a per-point Pydantic round-trip. Also the fallback
+    # when the rollup has not been populated for this window.
+    if not retailers_data:
+        rows = db.execute(
+            select(PriceHistory.retailer, PriceHistory.recorded_at, PriceHistory.price)
+            .where(
+                and_(
+                    PriceHistory.product_id == product_id,
+                    recorded_since_clause(db, days),
+                )
             )
+            .order_by(PriceHistory.recorded_at)
         )
+        for retailer, recorded_at, price in rows:
+            retailers_data.setdefault(retailer, []).append(
+                {"timestamp": recorded_at, "price": price}
+            )
 
-    return PriceHistoryChartResponse(
-        product_id=product_id,
-        product_name=product.name,
-        data_by_retailer=retailers_data,
+    return ORJSONResponse(
+        content={
+            "product_id": product_id,
+            "product_name": product_name,
+            "data_by_retailer": retailers_data,
+        }
     )
 
 
@@ -146,69 +201,125 @@ def get_price_history_stats(
     Returns:
         Price statistics including min, max, average, and trends
     """
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
+    end_date = datetime.now(timezone.utc)
+    cutoff_date = end_date - timedelta(days=days)
+
+    # Prefer the nightly daily rollup (at most one row per day and retailer)
+    # over scanning every raw entry; fall back to the raw table when the
+    # rollup has not been populated for this window.
+    stats = None
+    first_price = None
+    last_price = None
+    if days >= 2:
+        rollup = (
+            db.query(
+                func.min(PriceHistoryDaily.min_price).label("min_price"),
+                func.max(PriceHistoryDaily.max_price).label("max_price"),
+                (
+                    func.sum(PriceHistoryDaily.avg_price * PriceHistoryDaily.count)
+                    / func.sum(PriceHistoryDaily.count)
+                ).label("avg_price"),
+                func.sum(PriceHistoryDaily.count).label("total_records"),
+            )
+            .filter(
+                and_(
+                    PriceHistoryDaily.product_id == product_id,
+                    PriceHistoryDaily.day >= cutoff_date.date(),
+                )
+            )
+            .one()
         )
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        if rollup.total_records:
+            stats = rollup
+            # A per-(day, retailer) rollup row cannot say which retailer
+            # recorded chronologically first or last on the boundary days,
+            # so take the endpoints from the raw table with two indexed
+            # LIMIT 1 probes — the same semantics as the fallback below.
+            window = and_(
+                PriceHistory.product_id == product_id,
+                recorded_since_clause(db, days),
+            )
+            first_price = (
+                db.query(PriceHistory.price)
+                .filter(window)
+                .order_by(PriceHistory.recorded_at.asc())
+                .limit(1)
+                .scalar()
+            )
+            last_price = (
+                db.query(PriceHistory.price)
+                .filter(window)
+                .order_by(PriceHistory.recorded_at.desc())
+                .limit(1)
+                .scalar()
+            )
 
-    # Get statistics
-    stats = db.query(
-        func.min(PriceHistory.price).label("min_price"),
-        func.max(PriceHistory.price).label("max_price"),
-        func.avg(PriceHistory.price).label("avg_price"),
-        func.count(PriceHistory.id).label("total_records"),
-    ).filter(
-        and_(
-            PriceHistory.product_id == product_id,
-            PriceHistory.recorded_at >= cutoff_date,
+    if stats is None:
+        # Rank each entry from both ends so the aggregate query below can pick
+        # out the first and last prices without separate ORDER BY + LIMIT 1
+        # round-trips.
+        ordered = (
+            db.query(
+                PriceHistory.price.label("price"),
+                func.row_number()
+                .over(order_by=PriceHistory.recorded_at.asc())
+                .label("rn_asc"),
+                func.row_number()
+                .over(order_by=PriceHistory.recorded_at.desc())
+                .label("rn_desc"),
+            )
+            .filter(
+                and_(
+                    PriceHistory.product_id == product_id,
+                    recorded_since_clause(db, days),
+                )
+            )
+            .subquery()
         )
-    ).first()
+
+        # Get statistics plus first/last price in a single query
+        stats = db.query(
+            func.min(ordered.c.price).label("min_price"),
+            func.max(ordered.c.price).label("max_price"),
+            func.avg(ordered.c.price).label("avg_price"),
+            func.count(ordered.c.price).label("total_records"),
+            func.max(case((ordered.c.rn_asc == 1, ordered.c.price))).label("first_price"),
+            func.max(case((ordered.c.rn_desc == 1, ordered.c.price))).label("last_price"),
+        ).first()
+        if stats is not None:
+            first_price = stats.first_price
+            last_price = stats.last_price
 
     if not stats or stats.total_records == 0:
+        # No records in the window: only now spend the round-trip telling an
+        # unknown product apart from a known one with no history.
+        if not product_exists(db, product_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found",
+            )
         return PriceHistoryStats(
             product_id=product_id,
-            min_price=None,
-            max_price=None,
-            avg_price=None,
-            price_change=None,
+            min_price=0.0,
+            max_price=0.0,
+            avg_price=0.0,
             trend="stable",
             total_records=0,
+            start_date=cutoff_date,
+            end_date=end_date,
         )
 
-    # Get first and last prices to calculate trend
-    first_entry = (
-        db.query(PriceHistory)
-        .filter(
-            and_(
-                PriceHistory.product_id == product_id,
-                PriceHistory.recorded_at >= cutoff_date,
-            )
-        )
-        .order_by(PriceHistory.recorded_at.asc())
-        .first()
-    )
-
-    last_entry = (
-        db.query(PriceHistory)
-        .filter(
-            and_(
-                PriceHistory.product_id == product_id,
-                PriceHistory.recorded_at >= cutoff_date,
-            )
-        )
-        .order_by(PriceHistory.recorded_at.desc())
-        .first()
-    )
+    first_price = float(first_price) if first_price is not None else None
+    last_price = float(last_price) if last_price is not None else None
 
     price_change = None
+    price_change_pct = None
     trend = "stable"
-    if first_entry and last_entry:
-        price_change = last_entry.price - first_entry.price
+    if first_price is not None and last_price is not None:
+        price_change = round(last_price - first_price, 2)
+        if first_price:
+            price_change_pct = round((price_change / first_price) * 100, 2)
         if price_change > 0:
             trend = "increasing"
         elif price_change < 0:
@@ -216,12 +327,16 @@ def get_price_history_stats(
 
     return PriceHistoryStats(
         product_id=product_id,
-        min_price=float(stats.min_price) if stats.min_price else None,
-        max_price=float(stats.max_price) if stats.max_price else None,
-        avg_price=float(stats.avg_price) if stats.avg_price else None,
+        min_price=float(stats.min_price) if stats.min_price is not None else 0.0,
+        max_price=float(stats.max_price) if stats.max_price is not None else 0.0,
+        avg_price=float(stats.avg_price) if stats.avg_price is not None else 0.0,
+        current_price=last_price,
         price_change=price_change,
+        price_change_pct=price_change_pct,
         trend=trend,
-        total_records=stats.total_records,
+        total_records=int(stats.total_records),
+        start_date=cutoff_date,
+        end_date=end_date,
     )
 
 
@@ -265,18 +380,24 @@ def get_wishlist_item_price_history(
             detail="Wishlist item not found",
         )
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-
-    history = (
-        db.query(PriceHistory)
-        .filter(
+    # Column-only streaming select; see get_product_price_history above.
+    rows = db.execute(
+        select(
+            PriceHistory.id,
+            PriceHistory.product_id,
+            PriceHistory.retailer,
+            PriceHistory.price,
+            PriceHistory.currency,
+            PriceHistory.recorded_at,
+        )
+        .where(
             and_(
                 PriceHistory.product_id == wishlist_item.product_id,
-                PriceHistory.recorded_at >= cutoff_date,
+                recorded_since_clause(db, days),
             )
         )
         .order_by(desc(PriceHistory.recorded_at))
-        .all()
+        .execution_options(yield_per=1000)
     )
 
-    return history
+    return [dict(row) for row in rows.mappings()]
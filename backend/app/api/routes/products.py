@@ -2,22 +2,37 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
+from app.api.routing import TrustedDataAPIRoute
+from app.core.cache import clear_product_cache, clear_search_cache
 from app.db.database import get_db
 from app.models.product import Price, Product
 from app.schemas.product import (
+    PRICE_LIST_ADAPTER,
+    PRODUCT_LIST_ADAPTER,
+    PRODUCT_SUMMARY_LIST_ADAPTER,
     PriceCreate,
     PriceResponse,
     ProductCreate,
     ProductResponse,
+    ProductSummary,
     ProductUpdate,
     ProductWithPrices,
 )
-
-router = APIRouter(prefix="/products", tags=["products"])
+from app.services import search as search_service
+from app.services.product import list_products_summary, product_exists
+
+router = APIRouter(
+    prefix="/products",
+    tags=["products"],
+    # Handlers return schema instances built from trusted rows via
+    # from_orm_fast (or pre-serialized Responses), so the response-model
+    # re-validation pass is redundant work.
+    route_class=TrustedDataAPIRoute,
+)
 
 
 @router.get("", response_model=List[ProductResponse])
@@ -27,19 +42,21 @@ def list_products(
     brand: Optional[str] = Query(None, description="Filter by brand"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Keyset cursor: return products with an id greater than this "
+        "value (pass the last id of the previous page). Takes precedence over page.",
+    ),
     db: Session = Depends(get_db),
 ):
     """List and search products."""
     products_query = db.query(Product)
 
-    # Apply filters
+    # Apply filters (full-text search on Postgres, ILIKE fallback elsewhere)
     if query:
-        search_pattern = f"%{query}%"
         products_query = products_query.filter(
-            or_(
-                Product.name.ilike(search_pattern),
-                Product.description.ilike(search_pattern),
-            )
+            search_service.product_text_search_clause(db, query)
         )
 
     if category:
@@ -48,23 +65,66 @@ def list_products(
     if brand:
         products_query = products_query.filter(Product.brand == brand)
 
-    # Pagination
-    offset = (page - 1) * limit
-    products = products_query.offset(offset).limit(limit).all()
+    # Pagination: keyset (seek) when a cursor is given, so deep pages do not
+    # pay the scan-and-discard cost of OFFSET; page/offset kept as fallback.
+    products_query = products_query.order_by(Product.id.asc())
+    if cursor is not None:
+        products = products_query.filter(Product.id > cursor).limit(limit).all()
+    else:
+        offset = (page - 1) * limit
+        products = products_query.offset(offset).limit(limit).all()
+
+    # Single precompiled validate+dump pass over the page instead of
+    # per-element response-model validation and jsonable_encoder.
+    return Response(
+        PRODUCT_LIST_ADAPTER.dump_json(
+            PRODUCT_LIST_ADAPTER.validate_python(products, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
-    return products
+
+@router.get("/summary", response_model=List[ProductSummary])
+def list_products_summary_endpoint(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    brand: Optional[str] = Query(None, description="Filter by brand"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: Session = Depends(get_db),
+):
+    """List products with only the columns a listing renders.
+
+    Returns id, name, brand, category and the lowest in-stock price —
+    no description text and no nested price objects — which keeps both
+    the DB-to-app transfer and the response payload small. Use the
+    detail endpoint for the full product.
+    """
+    rows = list_products_summary(
+        db, skip=(page - 1) * limit, limit=limit, category=category, brand=brand
+    )
+    return Response(
+        PRODUCT_SUMMARY_LIST_ADAPTER.dump_json(
+            PRODUCT_SUMMARY_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/{product_id}", response_model=ProductWithPrices)
 def get_product(product_id: int, db: Session = Depends(get_db)):
     """Get a product by ID with its current prices."""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = (
+        db.query(Product)
+        .options(selectinload(Product.prices))
+        .filter(Product.id == product_id)
+        .first()
+    )
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
-    return product
+    return ProductWithPrices.from_orm_fast(product)
 
 
 @router.post("", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
@@ -72,9 +132,23 @@ def create_product(product_data: ProductCreate, db: Session = Depends(get_db)):
     """Create a new product."""
     product = Product(**product_data.model_dump())
     db.add(product)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Product names are unique (uq_products_name); surface the
+        # duplicate as a conflict instead of an unhandled 500.
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A product with this name already exists",
+        )
     db.refresh(product)
-    return product
+
+    # New product rows change cached listings, counts and suggestions.
+    clear_product_cache()
+    clear_search_cache()
+
+    return ProductResponse.from_orm_fast(product)
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
@@ -93,9 +167,22 @@ def update_product(
     for field, value in update_data.items():
         setattr(product, field, value)
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Renaming onto an existing product trips uq_products_name too.
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A product with this name already exists",
+        )
     db.refresh(product)
-    return product
+
+    # Name/category/brand edits invalidate cached listings and suggestions.
+    clear_product_cache()
+    clear_search_cache()
+
+    return ProductResponse.from_orm_fast(product)
 
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -111,14 +198,17 @@ def delete_product(product_id: int, db: Session = Depends(get_db)):
     db.delete(product)
     db.commit()
 
+    clear_product_cache()
+    clear_search_cache()
+
 
 @router.post(
     "/{product_id}/prices", response_model=PriceResponse, status_code=status.HTTP_201_CREATED
 )
 def add_price(product_id: int, price_data: PriceCreate, db: Session = Depends(get_db)):
     """Add a price entry for a product."""
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
+    # PK-only existence check instead of hydrating the full product
+    if not product_exists(db, product_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
@@ -135,17 +225,29 @@ def add_price(product_id: int, price_data: PriceCreate, db: Session = Depends(ge
     db.add(price)
     db.commit()
     db.refresh(price)
-    return price
+
+    # Price rows feed the deal-oriented search caches.
+    clear_search_cache()
+
+    return PriceResponse.from_orm_fast(price)
 
 
 @router.get("/{product_id}/prices", response_model=List[PriceResponse])
 def get_product_prices(product_id: int, db: Session = Depends(get_db)):
     """Get all prices for a product."""
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
+    prices = db.query(Price).filter(Price.product_id == product_id).all()
+
+    # Any price row proves the product exists; only spend the extra
+    # round-trip on the 404 check when the result came back empty.
+    if not prices and not product_exists(db, product_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
 
-    return product.prices
+    return Response(
+        PRICE_LIST_ADAPTER.dump_json(
+            PRICE_LIST_ADAPTER.validate_python(prices, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
@@ -1,16 +1,20 @@
 """Search routes for finding products and deals."""
 
+import re
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.cache import cached, clear_product_cache, clear_search_cache
 from app.db.database import get_db
 from app.models.product import Price, Product
 from app.schemas.product import ProductCreate, ProductResponse, ProductWithPrices
 from app.services import search as search_service
-from app.services.product import add_product_price, create_product
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -76,56 +80,101 @@ DEMO_RESULTS = {
 }
 
 
+# Compiled once at import so keyword dispatch is a single scan of the query
+# instead of one substring search per keyword on every zero-hit request.
+_DEMO_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, DEMO_RESULTS)), re.IGNORECASE
+)
+
+
 def _maybe_seed_demo_results(db: Session, query_text: str) -> None:
-    """When a search yields no rows, insert a small demo set for the query keyword."""
-
-    normalized = (query_text or "").lower()
-    for keyword, entries in DEMO_RESULTS.items():
-        if keyword in normalized:
-            for entry in entries:
-                # Skip if product already exists
-                exists = db.query(Product).filter(Product.name == entry["product"].name).first()
-                if exists:
-                    continue
-
-                product = create_product(db, entry["product"])
-                for price in entry.get("prices", []):
-                    add_product_price(
-                        db,
-                        product_id=product.id,
-                        retailer=price["retailer"],
-                        price=price["price"],
-                        url=price.get("url"),
-                        in_stock=True,
-                    )
-            break
+    """When a search yields no rows, insert a small demo set for the query keyword.
 
+    Inserts are batched: products go in atomically with a single
+    ON CONFLICT DO NOTHING insert (deduped by the unique product name),
+    followed by one bulk insert for the new products' prices and a single
+    commit.
+    """
 
-@router.get("/products", response_model=List[ProductResponse])
-def search_products(
-    q: Optional[str] = Query(None, description="Search query for product name or description"),
-    category: Optional[str] = Query(None, description="Filter by category"),
-    brand: Optional[str] = Query(None, description="Filter by brand"),
-    min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
-    max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
-    retailer: Optional[str] = Query(None, description="Filter by retailer"),
-    in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
-    page: int = Query(1, ge=1, description="Page number"),
-    limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    match = _DEMO_KEYWORDS_RE.search(query_text or "")
+    if not match:
+        return
+
+    entries = DEMO_RESULTS[match.group(0).lower()]
+
+    insert = (
+        postgresql.insert
+        if db.get_bind().dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    stmt = (
+        insert(Product)
+        .values([entry["product"].model_dump() for entry in entries])
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Product.id, Product.name)
+    )
+    # RETURNING yields only the rows actually inserted, so prices are never
+    # duplicated for products that already existed.
+    id_by_name = {name: product_id for product_id, name in db.execute(stmt)}
+    if not id_by_name:
+        db.rollback()
+        return
+
+    price_rows = [
+        {
+            "product_id": id_by_name[entry["product"].name],
+            "retailer": price["retailer"],
+            "price": price["price"],
+            "url": price.get("url"),
+            "in_stock": True,
+        }
+        for entry in entries
+        if entry["product"].name in id_by_name
+        for price in entry.get("prices", [])
+    ]
+    if price_rows:
+        db.bulk_insert_mappings(Price, price_rows)
+
+    db.commit()
+
+    # Seeding inserts products, so cached listings, counts and suggestions
+    # are stale until cleared.
+    clear_product_cache()
+    clear_search_cache()
+
+
+def _filtered_products_query(
+    db: Session,
+    q: Optional[str],
+    category: Optional[str],
+    brand: Optional[str],
+    min_price: Optional[float],
+    max_price: Optional[float],
+    retailer: Optional[str],
+    in_stock: Optional[bool],
 ):
-    """Search and filter products with various criteria."""
-    products_query = db.query(Product)
+    """Build the filtered product-search query shared by the list and
+    streaming endpoints.
+
+    Selects only the ProductResponse columns instead of hydrating full ORM
+    instances; rows come back as plain tuples with no identity-map
+    bookkeeping.
+    """
+    products_query = db.query(
+        Product.id,
+        Product.name,
+        Product.description,
+        Product.brand,
+        Product.category,
+        Product.image_url,
+        Product.created_at,
+        Product.updated_at,
+    )
 
-    # Text search on name and description
+    # Text search on name, description, and brand (full-text search on Postgres)
     if q:
-        search_pattern = f"%{q}%"
         products_query = products_query.filter(
-            or_(
-                Product.name.ilike(search_pattern),
-                Product.description.ilike(search_pattern),
-                Product.brand.ilike(search_pattern),
-            )
+            search_service.product_text_search_clause(db, q)
         )
 
     # Filter by category
@@ -136,35 +185,111 @@ def search_products(
     if brand:
         products_query = products_query.filter(Product.brand.ilike(f"%{brand}%"))
 
-    # Filter by price range and retailer (requires joining with prices table)
+    # Filter by price range and retailer via a correlated EXISTS; unlike
+    # join + DISTINCT this never materializes duplicated product rows, and
+    # the planner can stop at the first matching price per product.
     if min_price is not None or max_price is not None or retailer or in_stock is not None:
-        products_query = products_query.join(Price)
+        price_conditions = [Price.product_id == Product.id]
 
         if min_price is not None:
-            products_query = products_query.filter(Price.price >= min_price)
+            price_conditions.append(Price.price >= min_price)
 
         if max_price is not None:
-            products_query = products_query.filter(Price.price <= max_price)
+            price_conditions.append(Price.price <= max_price)
 
         if retailer:
-            products_query = products_query.filter(Price.retailer.ilike(f"%{retailer}%"))
+            price_conditions.append(Price.retailer.ilike(f"%{retailer}%"))
 
         if in_stock is not None:
-            products_query = products_query.filter(Price.in_stock == in_stock)
+            price_conditions.append(Price.in_stock == in_stock)
 
-        # Remove duplicates from join
-        products_query = products_query.distinct()
+        products_query = products_query.filter(
+            db.query(Price).filter(*price_conditions).exists()
+        )
 
-    # Pagination
-    offset = (page - 1) * limit
-    products = products_query.offset(offset).limit(limit).all()
+    return products_query
+
+
+@router.get("/products", response_model=List[ProductResponse])
+def search_products(
+    q: Optional[str] = Query(None, description="Search query for product name or description"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    brand: Optional[str] = Query(None, description="Filter by brand"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
+    retailer: Optional[str] = Query(None, description="Filter by retailer"),
+    in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Keyset cursor: return products with an id greater than this "
+        "value (pass the last id of the previous page). Takes precedence over page.",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Search and filter products with various criteria."""
+    products_query = _filtered_products_query(
+        db, q, category, brand, min_price, max_price, retailer, in_stock
+    )
+
+    # Pagination: keyset (seek) when a cursor is given, so deep pages do not
+    # pay the scan-and-discard cost of OFFSET; page/offset kept as fallback.
+    # Cursor paging needs a pure id ordering, so relevance ranking (Postgres
+    # full-text search only) applies on the page/offset path.
+    rank = search_service.product_text_search_rank(db, q) if q else None
+    if cursor is not None:
+        products_query = products_query.order_by(Product.id.asc())
+        products_query = products_query.filter(Product.id > cursor)
+        offset = 0
+    else:
+        if rank is not None:
+            products_query = products_query.order_by(rank.desc(), Product.id.asc())
+        else:
+            products_query = products_query.order_by(Product.id.asc())
+        offset = (page - 1) * limit
+    rows = products_query.offset(offset).limit(limit).all()
 
     # If no results, seed a small demo set for this query and retry once
-    if not products and q:
+    if not rows and q:
         _maybe_seed_demo_results(db, q)
-        products = products_query.offset(offset).limit(limit).all()
+        rows = products_query.offset(offset).limit(limit).all()
 
-    return products
+    return [ProductResponse.model_construct(**row._mapping) for row in rows]
+
+
+@router.get("/products.ndjson")
+def stream_search_products(
+    q: Optional[str] = Query(None, description="Search query for product name or description"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    brand: Optional[str] = Query(None, description="Filter by brand"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
+    retailer: Optional[str] = Query(None, description="Filter by retailer"),
+    in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum rows to stream"),
+    db: Session = Depends(get_db),
+):
+    """Stream search results as NDJSON (one product JSON object per line).
+
+    Rows are emitted as the database cursor yields them, so time to first
+    byte and peak memory stay flat regardless of the result size.
+    """
+    rows = (
+        _filtered_products_query(
+            db, q, category, brand, min_price, max_price, retailer, in_stock
+        )
+        .order_by(Product.id.asc())
+        .limit(limit)
+        .yield_per(100)
+    )
+
+    def generate():
+        for row in rows:
+            yield orjson.dumps(dict(row._mapping)) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/deals", response_model=List[ProductWithPrices])
@@ -173,22 +298,63 @@ def search_deals(
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor '<min_price>:<id>' taken from the last "
+        "product of the previous page. Takes precedence over page.",
+    ),
     db: Session = Depends(get_db),
 ):
     """Find products with the best deals (lowest prices, in stock)."""
-    products_query = db.query(Product).join(Price).filter(Price.in_stock.is_(True))
-
-    if category:
-        products_query = products_query.filter(Product.category.ilike(f"%{category}%"))
+    # Aggregate to one (product_id, min_price) row per product up front so no
+    # duplicated join rows need a DISTINCT pass, then order by that minimum.
+    min_price_subq = (
+        select(Price.product_id, func.min(Price.price).label("min_price"))
+        .where(Price.in_stock.is_(True))
+        .group_by(Price.product_id)
+    )
 
     if max_price is not None:
-        products_query = products_query.filter(Price.price <= max_price)
+        min_price_subq = min_price_subq.where(Price.price <= max_price)
+
+    min_price_subq = min_price_subq.subquery()
 
-    # Order by lowest price
-    products_query = products_query.order_by(Price.price.asc()).distinct()
+    # Eager-load prices in one bulk query; the response nests them per product
+    # and lazy loading would otherwise issue one SELECT per row.
+    products_query = (
+        db.query(Product)
+        .options(selectinload(Product.prices))
+        .join(min_price_subq, Product.id == min_price_subq.c.product_id)
+        .order_by(min_price_subq.c.min_price.asc(), Product.id.asc())
+    )
 
-    # Pagination
-    offset = (page - 1) * limit
+    if category:
+        products_query = products_query.filter(Product.category.ilike(f"%{category}%"))
+
+    # Pagination: keyset (seek) on (min_price, id) when a cursor is given, so
+    # deep pages do not pay the scan-and-discard cost of OFFSET.
+    if cursor is not None:
+        try:
+            last_price_raw, last_id_raw = cursor.split(":", 1)
+            last_price = float(last_price_raw)
+            last_id = int(last_id_raw)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor; expected '<min_price>:<id>'",
+            )
+        products_query = products_query.filter(
+            or_(
+                min_price_subq.c.min_price > last_price,
+                and_(
+                    min_price_subq.c.min_price == last_price,
+                    Product.id > last_id,
+                ),
+            )
+        )
+        offset = 0
+    else:
+        offset = (page - 1) * limit
     products = products_query.offset(offset).limit(limit).all()
 
     return products
@@ -198,10 +364,13 @@ def search_deals(
 def get_search_suggestions(
     q: str = Query(..., min_length=1, description="Partial search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+    contains: bool = Query(
+        False, description="Match anywhere in the name instead of as a prefix"
+    ),
     db: Session = Depends(get_db),
 ):
     """Get search suggestions based on product names."""
-    return search_service.get_search_suggestions(db, q, limit)
+    return search_service.get_search_suggestions(db, q, limit, contains)
 
 
 @router.get("/location", response_model=List[ProductResponse])
@@ -231,6 +400,7 @@ def search_products_by_location(
 
 
 @router.get("/coordinates")
+@cached(ttl_seconds=3600)
 def get_coordinates_from_zip(
     zip_code: str = Query(..., min_length=5, max_length=5, description="US 5-digit zip code"),
 ):
@@ -4,10 +4,11 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps import get_current_active_user
+from app.core.cache import clear_cache_pattern
 from app.db.database import get_db
 from app.models.price_history import PriceHistory
 from app.models.product import Price, Product
@@ -25,6 +26,7 @@ from app.schemas.wishlist import (
     WishlistItemUpdate,
     WishlistItemWithProduct,
 )
+from app.services.product import product_exists
 
 router = APIRouter(prefix="/wishlist", tags=["wishlist"])
 
@@ -36,7 +38,12 @@ def get_wishlist(
 ):
     """Get current user's wishlist."""
     wishlist_items = (
-        db.query(WishlistItem).filter(WishlistItem.user_id == current_user.id).all()
+        db.query(WishlistItem)
+        # WishlistItemWithProduct.product is a ProductResponse with no
+        # prices field, so eager-load only the product itself.
+        .options(selectinload(WishlistItem.product))
+        .filter(WishlistItem.user_id == current_user.id)
+        .all()
     )
     return wishlist_items
 
@@ -48,24 +55,28 @@ def add_to_wishlist(
     db: Session = Depends(get_db),
 ):
     """Add a product to the wishlist."""
-    # Check if product exists
-    product = db.query(Product).filter(Product.id == item_data.product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
-
-    # Check if already in wishlist
-    existing = (
-        db.query(WishlistItem)
+    # Batch the product-existence and duplicate checks into one round trip:
+    # SELECT EXISTS(...), EXISTS(...) returns both flags at once.
+    product_ok, already_listed = db.query(
+        db.query(Product.id)
+        .filter(Product.id == item_data.product_id)
+        .exists()
+        .label("product_ok"),
+        db.query(WishlistItem.id)
         .filter(
             WishlistItem.user_id == current_user.id,
             WishlistItem.product_id == item_data.product_id,
         )
-        .first()
-    )
-    if existing:
+        .exists()
+        .label("already_listed"),
+    ).one()
+
+    if not product_ok:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
+    if already_listed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Product already in wishlist",
@@ -91,22 +102,39 @@ def update_wishlist_item(
     db: Session = Depends(get_db),
 ):
     """Update a wishlist item (e.g., target price)."""
-    item = (
-        db.query(WishlistItem)
-        .filter(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
-        .first()
-    )
-    if not item:
+    values = item_update.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        # Nothing to change; a plain ownership-scoped lookup suffices.
+        item = (
+            db.query(WishlistItem)
+            .filter(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
+            .first()
+        )
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Wishlist item not found",
+            )
+        return item
+
+    # Single UPDATE ... RETURNING round trip: the ownership check, the write
+    # and the refreshed row all come back from one statement.
+    item = db.execute(
+        update(WishlistItem)
+        .where(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
+        .values(**values)
+        .returning(WishlistItem)
+    ).scalar_one_or_none()
+    if item is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wishlist item not found",
         )
-
-    if item_update.target_price is not None:
-        item.target_price = item_update.target_price
-
     db.commit()
-    db.refresh(item)
+
+    # Target-price changes alter alert status; drop this user's cached
+    # statuses like the alert routes do.
+    clear_cache_pattern(f"get_alert_status:{current_user.id}:*")
 
     return item
 
@@ -118,20 +146,23 @@ def remove_from_wishlist(
     db: Session = Depends(get_db),
 ):
     """Remove a product from the wishlist."""
-    item = (
-        db.query(WishlistItem)
-        .filter(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
-        .first()
-    )
-    if not item:
+    # Single DELETE ... RETURNING round trip; the returned id doubles as the
+    # existence/ownership check.
+    deleted_id = db.execute(
+        delete(WishlistItem)
+        .where(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
+        .returning(WishlistItem.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wishlist item not found",
         )
-
-    db.delete(item)
     db.commit()
 
+    # The deleted item may still have a cached alert status.
+    clear_cache_pattern(f"get_alert_status:{current_user.id}:*")
+
 
 @router.get(
     "/{item_id}/price-history", response_model=PriceHistoryChartResponse
@@ -147,76 +178,96 @@ def get_wishlist_item_price_history(
 
     Returns historical price data and statistics for charting.
     """
-    # Get wishlist item
-    item = (
-        db.query(WishlistItem)
+    # Fetch the wishlist item and its product in one joined query instead of
+    # two serial lookups; the join can only drop rows if the product row is
+    # gone, so both 404s still fall out of the single result.
+    row = (
+        db.query(WishlistItem, Product)
+        .join(Product, Product.id == WishlistItem.product_id)
         .filter(WishlistItem.id == item_id, WishlistItem.user_id == current_user.id)
         .first()
     )
-    if not item:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wishlist item not found",
         )
-
-    # Get product
-    product = db.query(Product).filter(Product.id == item.product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
+    item, product = row
 
     # Calculate date range
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
 
-    # Query price history
-    query = db.query(PriceHistory).filter(
+    # Push the statistics into one SQL aggregate query: each row is ranked
+    # from both ends so first/last prices come out of the same round trip as
+    # min/max/avg/count, with no per-row Python arithmetic.
+    history_filter = [
         PriceHistory.product_id == item.product_id,
         PriceHistory.recorded_at >= start_date,
-    )
-
+    ]
     if retailer:
-        query = query.filter(PriceHistory.retailer == retailer)
+        history_filter.append(PriceHistory.retailer == retailer)
+
+    ordered = (
+        db.query(
+            PriceHistory.price.label("price"),
+            func.row_number()
+            .over(order_by=PriceHistory.recorded_at.asc())
+            .label("rn_asc"),
+            func.row_number()
+            .over(order_by=PriceHistory.recorded_at.desc())
+            .label("rn_desc"),
+        )
+        .filter(*history_filter)
+        .subquery()
+    )
 
-    history = query.order_by(PriceHistory.recorded_at.asc()).all()
+    agg = db.query(
+        func.min(ordered.c.price).label("min_price"),
+        func.max(ordered.c.price).label("max_price"),
+        func.avg(ordered.c.price).label("avg_price"),
+        func.count(ordered.c.price).label("total_records"),
+        func.max(case((ordered.c.rn_asc == 1, ordered.c.price))).label("first_price"),
+        func.max(case((ordered.c.rn_desc == 1, ordered.c.price))).label("last_price"),
+    ).first()
+
+    # Stream only the chart columns in batches; no ORM identity map overhead.
+    rows = db.execute(
+        select(
+            PriceHistory.recorded_at,
+            PriceHistory.price,
+            PriceHistory.retailer,
+        )
+        .where(*history_filter)
+        .order_by(PriceHistory.recorded_at.asc())
+        .execution_options(yield_per=1000)
+    )
 
-    # Build chart data
     chart_data = [
-        PriceHistoryChartData(
-            date=h.recorded_at,
-            price=h.price,
-            retailer=h.retailer,
+        PriceHistoryChartData.model_construct(
+            date=recorded_at,
+            price=price,
+            retailer=row_retailer,
         )
-        for h in history
+        for recorded_at, price, row_retailer in rows
     ]
 
-    # Calculate statistics
-    if history:
-        prices = [h.price for h in history]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
-        current_price = prices[-1] if prices else None
-
+    if chart_data:
         # Calculate price change percentage
-        if len(prices) >= 2:
-            oldest_price = prices[0]
-            if oldest_price > 0:
-                price_change_pct = ((prices[-1] - oldest_price) / oldest_price) * 100
-            else:
-                price_change_pct = 0.0
+        if agg.total_records >= 2 and agg.first_price > 0:
+            price_change_pct = (
+                (agg.last_price - agg.first_price) / agg.first_price
+            ) * 100
         else:
             price_change_pct = 0.0
 
         stats = PriceHistoryStats(
             product_id=item.product_id,
             retailer=retailer,
-            min_price=min_price,
-            max_price=max_price,
-            avg_price=round(avg_price, 2),
-            current_price=current_price,
+            min_price=agg.min_price,
+            max_price=agg.max_price,
+            avg_price=round(agg.avg_price, 2),
+            current_price=agg.last_price,
             price_change_pct=round(price_change_pct, 2),
             start_date=start_date,
             end_date=end_date,
@@ -254,27 +305,41 @@ def get_product_price_history(
 
     This endpoint is public and doesn't require authentication.
     """
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
-
     # Calculate date range
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
 
-    # Query price history
-    query = db.query(PriceHistory).filter(
+    # Select only the response columns and stream them in batches instead of
+    # materializing full ORM objects for every row in the window.
+    query = select(
+        PriceHistory.id,
+        PriceHistory.product_id,
+        PriceHistory.retailer,
+        PriceHistory.price,
+        PriceHistory.currency,
+        PriceHistory.recorded_at,
+    ).where(
         PriceHistory.product_id == product_id,
         PriceHistory.recorded_at >= start_date,
     )
 
     if retailer:
-        query = query.filter(PriceHistory.retailer == retailer)
+        query = query.where(PriceHistory.retailer == retailer)
 
-    history = query.order_by(PriceHistory.recorded_at.desc()).all()
+    rows = db.execute(
+        query.order_by(PriceHistory.recorded_at.desc()).execution_options(
+            yield_per=1000
+        )
+    )
+
+    results = [PriceHistoryResponse.model_construct(**row._mapping) for row in rows]
+
+    # Any history row proves the product exists; only spend the extra
+    # round-trip on the 404 check when the window came back empty.
+    if not results and not product_exists(db, product_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
 
-    return history
+    return results
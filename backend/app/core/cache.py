@@ -1,6 +1,10 @@
 """Caching utilities for search and frequently accessed data."""
 
-import json
+import hashlib
+import time
+from decimal import Decimal
+
+import orjson
 import redis
 from typing import Optional, Any, Callable
 from functools import wraps
@@ -10,7 +14,7 @@ from app.core.config import get_settings
 settings = get_settings()
 
 # Initialize Redis connection
-redis_client = Optional[redis.Redis] = None
+redis_client: Optional[redis.Redis] = None
 
 
 def get_redis_client() -> Optional[redis.Redis]:
@@ -18,7 +22,13 @@ def get_redis_client() -> Optional[redis.Redis]:
     global redis_client
     if redis_client is None:
         try:
-            redis_client = redis.from_url(settings.redis_url)
+            # Share one bounded connection pool across the process so
+            # concurrent requests reuse established TCP connections instead
+            # of re-handshaking per call.
+            pool = redis.ConnectionPool.from_url(
+                settings.redis_url, max_connections=32
+            )
+            redis_client = redis.Redis(connection_pool=pool)
             # Test connection
             redis_client.ping()
         except Exception as e:
@@ -28,48 +38,87 @@ def get_redis_client() -> Optional[redis.Redis]:
 
 
 def cache_key(*args, **kwargs) -> str:
-    """Generate a cache key from function arguments."""
-    key_parts = [str(arg) for arg in args if arg is not None]
-    key_parts.extend([f"{k}={v}" for k, v in sorted(kwargs.items()) if v is not None])
-    return ":".join(key_parts)
+    """Generate a cache key from function arguments.
+
+    Only primitive arguments participate in the key; sessions and other
+    rich objects (whose repr varies per request) are skipped. The canonical
+    argument string is hashed so keys stay short and uniform regardless of
+    query length.
+    """
+    primitives = (str, int, float, bool)
+    key_parts = [str(arg) for arg in args if isinstance(arg, primitives)]
+    key_parts.extend(
+        [f"{k}={v}" for k, v in sorted(kwargs.items()) if isinstance(v, primitives)]
+    )
+    canonical = ":".join(key_parts)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the types orjson does not handle natively (it already covers
+    datetime/date and dataclasses in C)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
 
 
-def cached(ttl_seconds: int = 3600):
+def cached(ttl_seconds: int = 3600, key_builder: Optional[Callable] = None):
     """Decorator to cache function results in Redis.
-    
+
     Args:
         ttl_seconds: Time to live in seconds
+        key_builder: Optional callable building the key suffix from the call
+            arguments. Required for per-user endpoints so results are never
+            shared across users.
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             redis_conn = get_redis_client()
-            
+
             if redis_conn is None:
                 # If Redis is not available, just call the function
                 return func(*args, **kwargs)
-            
+
             # Generate cache key
             func_name = func.__name__
-            key = f"{func_name}:{cache_key(*args, **kwargs)}"
+            if key_builder is not None:
+                key = f"{func_name}:{key_builder(*args, **kwargs)}"
+            else:
+                key = f"{func_name}:{cache_key(*args, **kwargs)}"
             
             # Try to get from cache
             try:
                 cached_result = redis_conn.get(key)
                 if cached_result:
-                    return json.loads(cached_result)
+                    return orjson.loads(cached_result)
+
+                # Miss: take a short-lived lock so concurrent misses do not
+                # all recompute ("thundering herd"). Losers wait briefly and
+                # re-check; if the winner has not filled the key yet they
+                # fall through and compute anyway rather than block.
+                lock_key = f"{key}:lock"
+                if not redis_conn.set(lock_key, "1", nx=True, ex=5):
+                    time.sleep(0.05)
+                    cached_result = redis_conn.get(key)
+                    if cached_result:
+                        return orjson.loads(cached_result)
             except Exception as e:
                 print(f"Cache retrieval error: {e}")
-            
+
             # Call function and cache result
             result = func(*args, **kwargs)
-            
+
             try:
-                redis_conn.setex(
+                # Fill the key and release the refill lock in one round trip.
+                pipe = redis_conn.pipeline()
+                pipe.setex(
                     key,
                     ttl_seconds,
-                    json.dumps(result, default=str)
+                    orjson.dumps(result, default=_orjson_default),
                 )
+                pipe.delete(f"{key}:lock")
+                pipe.execute()
             except Exception as e:
                 print(f"Cache storage error: {e}")
             
@@ -98,3 +147,9 @@ def clear_search_cache() -> None:
     clear_cache_pattern("search_products*")
     clear_cache_pattern("get_search_suggestions*")
     clear_cache_pattern("get_deals*")
+
+
+def clear_product_cache() -> None:
+    """Clear cached product listings and counts after a product write."""
+    clear_cache_pattern("_get_product_ids*")
+    clear_cache_pattern("count_products*")
@@ -3,42 +3,107 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 import hashlib
+import os
+import threading
+import time
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import argon2
+import bcrypt
+import jwt
+from cryptography.hazmat.primitives import serialization
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-# Password hashing context - use argon2 instead of bcrypt to avoid 72-byte limit
-# or pre-hash long passwords with SHA256 before bcrypt
-try:
-    # Try to use argon2 if available, otherwise fall back to bcrypt with pre-hashing
-    pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
-except Exception:
-    # Fallback to bcrypt only if argon2 is not available
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Token signing parameters, bound once at import. Every auth call used to
+# re-dereference them off the BaseSettings instance; as module globals they
+# are plain immutable lookups on the hot path.
+#
+# When secret_key holds an Ed25519 private key in PEM form, tokens are
+# signed with EdDSA: the key objects are parsed once here and handed to
+# PyJWT directly, so per-call work is a single precomputed OpenSSL signature
+# instead of re-deriving an HMAC key schedule (and decode no longer needs
+# the signing secret at all). A plain string secret keeps the configured
+# HMAC algorithm, so existing deployments and their tokens are untouched.
+if settings.secret_key.startswith("-----BEGIN"):
+    _SIGNING_KEY = serialization.load_pem_private_key(
+        settings.secret_key.encode(), password=None
+    )
+    _VERIFY_KEY = _SIGNING_KEY.public_key()
+    _ALGO = "EdDSA"
+else:
+    _SIGNING_KEY = _VERIFY_KEY = settings.secret_key
+    _ALGO = settings.algorithm
+_ALGOS = [_ALGO]
+_EXP_MIN = settings.access_token_expire_minutes
+
+# Hasher for new passwords, configured to the OWASP Argon2id baseline
+# (46 MiB, t=2). Calling argon2-cffi directly skips passlib's per-call
+# scheme dispatch and identifier parsing; the hash format is the standard
+# $argon2id$ string, so hashes from the previous passlib setup still verify.
+#
+# parallelism follows the container's CPU count so Argon2's lane parallelism
+# is actually exercised. DEPLOYMENT NOTE: install argon2-cffi-bindings from
+# source with CFLAGS="-O3 -march=native" to compile the SIMD (SSSE3/AVX2)
+# BlaMka round instead of the portable reference implementation.
+_password_hasher = argon2.PasswordHasher(
+    time_cost=2, memory_cost=47104, parallelism=os.cpu_count() or 1
+)
+
+# Bound on concurrent KDF work. Handlers are sync `def` routes, so FastAPI
+# already runs them on its threadpool (hashing never blocks the event loop),
+# but the pool admits far more threads than cores — a burst of logins would
+# otherwise run dozens of 46 MiB Argon2 instances at once. Queueing beyond
+# roughly one per core keeps memory flat and finishes sooner than thrashing.
+_HASH_SEM = threading.BoundedSemaphore(max(2, os.cpu_count() or 1))
+
+
+def _prehash_candidates(password: str) -> list:
+    """Pre-hash inputs for passwords longer than bcrypt's 72-byte limit.
+
+    New hashes use the raw 32-byte SHA-256 digest (full 256 bits of entropy,
+    half the bytes of the hex form). Hashes stored before this change were
+    created from the 64-character hexdigest, so verification also tries that
+    legacy form. Short passwords pass through untouched.
+    """
+    raw = password.encode('utf-8')
+    if len(raw) <= 72:
+        return [raw]
+    return [hashlib.sha256(raw).digest(), hashlib.sha256(raw).hexdigest().encode()]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    # Pre-hash long passwords before verification
-    if len(plain_password.encode('utf-8')) > 72:
-        plain_password = hashlib.sha256(plain_password.encode('utf-8')).hexdigest()
-    return pwd_context.verify(plain_password, hashed_password)
+    with _HASH_SEM:
+        for candidate in _prehash_candidates(plain_password):
+            if hashed_password.startswith("$argon2"):
+                try:
+                    if _password_hasher.verify(hashed_password, candidate):
+                        return True
+                except (
+                    argon2.exceptions.VerificationError,
+                    argon2.exceptions.InvalidHashError,
+                ):
+                    continue
+            else:
+                # Legacy bcrypt hashes ($2a/$2b prefixes)
+                try:
+                    if bcrypt.checkpw(candidate, hashed_password.encode('utf-8')):
+                        return True
+                except ValueError:
+                    continue
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password for storage.
-    
+
     Uses SHA256 pre-hashing for passwords longer than 72 bytes (bcrypt limit),
-    then bcrypt for the final hash.
+    then Argon2id for the final hash.
     """
-    # Pre-hash with SHA256 if password is too long for bcrypt
-    if len(password.encode('utf-8')) > 72:
-        password = hashlib.sha256(password.encode('utf-8')).hexdigest()
-    return pwd_context.hash(password)
+    with _HASH_SEM:
+        return _password_hasher.hash(_prehash_candidates(password)[0])
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -47,22 +112,50 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+        expire = datetime.now(timezone.utc) + timedelta(minutes=_EXP_MIN)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
-    )
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALGO)
     return encoded_jwt
 
 
+# Short-lived verification cache: every authenticated request decodes a
+# bearer token, and high-QPS clients resend the same one, so repeat
+# verifications within the window collapse to a dict lookup. Entries never
+# outlive the token's own exp, and failures are never cached.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict = {}
+_token_cache_lock = threading.Lock()
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT access token."""
+    now = time.time()
+
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+    if entry is not None:
+        payload, cached_until = entry
+        if cached_until > now and payload.get("exp", 0) > now:
+            return payload
+
     try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, _VERIFY_KEY, algorithms=_ALGOS)
+    except jwt.InvalidTokenError:
         return None
+
+    cached_until = min(now + _TOKEN_CACHE_TTL, float(payload.get("exp", 0)))
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            # Drop stale entries; clear outright if the cache is full of
+            # still-live tokens.
+            live = {
+                tok: (pl, until)
+                for tok, (pl, until) in _token_cache.items()
+                if until > now
+            }
+            _token_cache.clear()
+            if len(live) < _TOKEN_CACHE_MAX:
+                _token_cache.update(live)
+        _token_cache[token] = (payload, cached_until)
+    return payload
@@ -2,7 +2,9 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
 from app.api.routes import auth, products, search, users, wishlist, alerts, price_history
@@ -12,8 +14,8 @@ from app.models.product import Price, Product
 
 settings = get_settings()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Advisory lock key guarding schema creation/seeding across workers
+_BOOTSTRAP_LOCK_KEY = 746576
 
 
 def seed_sample_data() -> None:
@@ -21,43 +23,65 @@ def seed_sample_data() -> None:
 
     db: Session = SessionLocal()
     try:
-        if db.query(Product).count() > 0:
+        # Emptiness probe: LIMIT 1 instead of a full COUNT(*) scan
+        if db.query(Product.id).first() is not None:
             return
 
-        sax1 = Product(
-            name="Yamaha YAS-280 Alto Saxophone",
-            brand="Yamaha",
-            category="Instruments",
-            description="Student alto sax with case and mouthpiece.",
-            image_url="https://example.com/yamaha-yas-280.jpg",
-        )
-        sax2 = Product(
-            name="Jean Paul USA TS-400 Tenor Saxophone",
-            brand="Jean Paul",
-            category="Instruments",
-            description="Tenor saxophone with deluxe carrying case.",
-            image_url="https://example.com/jean-paul-ts-400.jpg",
-        )
-        sax3 = Product(
-            name="Selmer Prelude AS711 Alto Sax",
-            brand="Selmer",
-            category="Instruments",
-            description="Entry-level alto sax, great for beginners.",
-            image_url="https://example.com/selmer-prelude-as711.jpg",
-        )
-
-        db.add_all([sax1, sax2, sax3])
-        db.flush()  # assign IDs for prices
-
-        prices = [
-            Price(product_id=sax1.id, retailer="Sweetwater", price=1299.99, url="https://example.com/yamaha-yas-280/sweetwater"),
-            Price(product_id=sax1.id, retailer="Guitar Center", price=1199.99, url="https://example.com/yamaha-yas-280/gc"),
-            Price(product_id=sax2.id, retailer="Amazon", price=899.00, url="https://example.com/ts-400/amazon"),
-            Price(product_id=sax2.id, retailer="Reverb", price=859.50, url="https://example.com/ts-400/reverb"),
-            Price(product_id=sax3.id, retailer="Sweetwater", price=699.99, url="https://example.com/as711/sweetwater"),
+        product_rows = [
+            {
+                "name": "Yamaha YAS-280 Alto Saxophone",
+                "brand": "Yamaha",
+                "category": "Instruments",
+                "description": "Student alto sax with case and mouthpiece.",
+                "image_url": "https://example.com/yamaha-yas-280.jpg",
+            },
+            {
+                "name": "Jean Paul USA TS-400 Tenor Saxophone",
+                "brand": "Jean Paul",
+                "category": "Instruments",
+                "description": "Tenor saxophone with deluxe carrying case.",
+                "image_url": "https://example.com/jean-paul-ts-400.jpg",
+            },
+            {
+                "name": "Selmer Prelude AS711 Alto Sax",
+                "brand": "Selmer",
+                "category": "Instruments",
+                "description": "Entry-level alto sax, great for beginners.",
+                "image_url": "https://example.com/selmer-prelude-as711.jpg",
+            },
         ]
-
-        db.add_all(prices)
+        price_rows_by_name = {
+            "Yamaha YAS-280 Alto Saxophone": [
+                {"retailer": "Sweetwater", "price": 1299.99, "url": "https://example.com/yamaha-yas-280/sweetwater"},
+                {"retailer": "Guitar Center", "price": 1199.99, "url": "https://example.com/yamaha-yas-280/gc"},
+            ],
+            "Jean Paul USA TS-400 Tenor Saxophone": [
+                {"retailer": "Amazon", "price": 899.00, "url": "https://example.com/ts-400/amazon"},
+                {"retailer": "Reverb", "price": 859.50, "url": "https://example.com/ts-400/reverb"},
+            ],
+            "Selmer Prelude AS711 Alto Sax": [
+                {"retailer": "Sweetwater", "price": 699.99, "url": "https://example.com/as711/sweetwater"},
+            ],
+        }
+
+        # Two batched Core INSERTs instead of per-row ORM flushes: the first
+        # returns the generated ids, the second fans them out to the prices.
+        id_by_name = {
+            name: product_id
+            for product_id, name in db.execute(
+                insert(Product)
+                .values(product_rows)
+                .returning(Product.id, Product.name)
+            )
+        }
+        db.execute(
+            insert(Price),
+            [
+                {"product_id": id_by_name[name], **price_row}
+                for name, rows in price_rows_by_name.items()
+                for price_row in rows
+            ],
+        )
         db.commit()
     finally:
         db.close()
@@ -69,6 +93,9 @@ app = FastAPI(
     description="A modern shopping application for finding deals and tracking prices.",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes responses in native code; pure-Python json.dumps was
+    # a measurable cost on the list endpoints that return thousands of rows.
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -91,8 +118,39 @@ app.include_router(alerts.router, prefix=settings.api_v1_prefix)
 app.include_router(price_history.router, prefix=settings.api_v1_prefix)
 
 
-# Seed demo data at startup so product search returns results immediately
-seed_sample_data()
+@app.on_event("startup")
+def bootstrap_database() -> None:
+    """Create tables and seed demo data once per process at startup.
+
+    Running this from the startup hook instead of import time keeps module
+    import side-effect free (no DDL during test collection or reloads). On
+    PostgreSQL an advisory lock serializes the DDL/seed across workers so
+    `uvicorn --workers N` does not race N duplicate bootstrap transactions.
+    """
+    if engine.dialect.name == "postgresql":
+        # Warm the steady-state pool so the first requests do not pay the
+        # TCP/TLS handshake; connections must be held together or close()
+        # would hand the same one back each time.
+        warm = [engine.connect() for _ in range(engine.pool.size())]
+        for conn in warm:
+            conn.close()
+
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": _BOOTSTRAP_LOCK_KEY}
+            )
+            try:
+                Base.metadata.create_all(bind=engine)
+                seed_sample_data()
+            finally:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": _BOOTSTRAP_LOCK_KEY},
+                )
+    else:
+        Base.metadata.create_all(bind=engine)
+        # Seed demo data so product search returns results immediately
+        seed_sample_data()
 
 
 @app.get("/")
@@ -1,9 +1,24 @@
 """SQLAlchemy models."""
 
+from sqlalchemy.orm import configure_mappers
+
 from app.models.user import User
 from app.models.product import Product, Price
 from app.models.retailer import Retailer
 from app.models.wishlist import WishlistItem
-from app.models.price_history import PriceHistory
+from app.models.price_history import PriceHistory, PriceHistoryDaily
+
+__all__ = [
+    "User",
+    "Product",
+    "Price",
+    "Retailer",
+    "WishlistItem",
+    "PriceHistory",
+    "PriceHistoryDaily",
+]
 
-__all__ = ["User", "Product", "Price", "Retailer", "WishlistItem", "PriceHistory"]
+# Every mapped class is imported above, so resolve all relationship()
+# strings eagerly now rather than lazily (under a registry lock) on the
+# first query each worker runs.
+configure_mappers()
@@ -1,7 +1,17 @@
 """Price history database model for tracking price changes over time."""
 
-from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -11,15 +21,59 @@ class PriceHistory(Base):
     """Price history model for storing historical price data."""
 
     __tablename__ = "price_history"
+    __table_args__ = (
+        # Every price-history query filters by product then orders by time, so
+        # composite indexes turn those into index range scans without a sort.
+        # INCLUDE makes them covering on PostgreSQL: the chart and stats
+        # queries read only indexed columns and never touch the heap. The
+        # composites also make separate single-column indexes on product_id /
+        # retailer / recorded_at redundant (leftmost-prefix rule), so those
+        # are gone.
+        Index(
+            "ix_price_history_product_recorded",
+            "product_id",
+            text("recorded_at DESC"),
+            postgresql_include=["price", "retailer", "currency"],
+        ),
+        Index(
+            "ix_price_history_product_retailer_recorded",
+            "product_id",
+            "retailer",
+            text("recorded_at DESC"),
+            postgresql_include=["price"],
+        ),
+        # The nightly retention cleanup filters on recorded_at alone, which
+        # the product_id-leading composites cannot serve; this keeps the
+        # cutoff predicate an index range scan instead of a full-table scan.
+        Index("ix_price_history_recorded_at", "recorded_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), index=True, nullable=False)
-    retailer = Column(String, index=True, nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    retailer = Column(String, nullable=False)
     price = Column(Float, nullable=False)
     currency = Column(String, default="USD")
-    recorded_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), index=True
-    )
+    recorded_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     product = relationship("Product", back_populates="price_history")
+
+
+class PriceHistoryDaily(Base):
+    """Daily rollup of price history per product and retailer.
+
+    Maintained by the rollup_price_history_daily Celery task so stats
+    queries read at most one row per day instead of every raw entry.
+    """
+
+    __tablename__ = "price_history_daily"
+
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    retailer = Column(String, primary_key=True)
+    min_price = Column(Float, nullable=False)
+    max_price = Column(Float, nullable=False)
+    avg_price = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+    first_price = Column(Float, nullable=False)
+    last_price = Column(Float, nullable=False)
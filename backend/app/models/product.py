@@ -1,7 +1,18 @@
 """Product database model."""
 
-from datetime import datetime, timezone
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -11,19 +22,43 @@ class Product(Base):
     """Product model for storing product information."""
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Functional index serving the anchored lower(name) LIKE 'prefix%'
+        # lookup used by search suggestions.
+        Index("ix_products_name_lower", text("lower(name)")),
+        # Unique index so seeding can dedupe with ON CONFLICT DO NOTHING.
+        Index("uq_products_name", "name", unique=True),
+        # Category/brand list pages filter on one column and paginate by id;
+        # leading on the filter with id second serves the page in index
+        # order, and the INCLUDE payload lets the summary select run as an
+        # index-only scan on PostgreSQL. Subsumes a single-column category
+        # index via the leftmost prefix.
+        Index(
+            "ix_products_category_id",
+            "category",
+            "id",
+            postgresql_include=["name", "brand"],
+        ),
+        Index(
+            "ix_products_brand_id",
+            "brand",
+            "id",
+            postgresql_include=["name", "category"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True, nullable=False)
+    # No index=True: uq_products_name above already gives name a B-tree.
+    name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     brand = Column(String, nullable=True)
-    category = Column(String, index=True, nullable=True)
+    category = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
-    )
+    # server_default lets bulk Core INSERTs omit the column entirely instead
+    # of evaluating a Python lambda per row; the database clock is also the
+    # single source of truth across workers.
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     prices = relationship("Price", back_populates="product")
@@ -35,16 +70,23 @@ class Price(Base):
     """Price model for tracking product prices at different retailers."""
 
     __tablename__ = "prices"
+    __table_args__ = (
+        # Price lookups filter by product and usually retailer or price order;
+        # the composites serve both shapes and subsume separate single-column
+        # indexes on product_id and retailer.
+        Index("ix_prices_product_retailer", "product_id", "retailer"),
+        Index("ix_prices_product_price", "product_id", "price"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), index=True, nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     retailer_id = Column(Integer, ForeignKey("retailers.id"), index=True, nullable=True)
-    retailer = Column(String, index=True, nullable=False)
+    retailer = Column(String, nullable=False)
     price = Column(Float, nullable=False)
     currency = Column(String, default="USD")
     url = Column(String, nullable=True)
     in_stock = Column(Boolean, default=True)
-    scraped_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    scraped_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     product = relationship("Product", back_populates="prices")
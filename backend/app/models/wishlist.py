@@ -1,7 +1,6 @@
 """Wishlist database model."""
 
-from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -11,12 +10,18 @@ class WishlistItem(Base):
     """Wishlist item model for user's saved products."""
 
     __tablename__ = "wishlist_items"
+    __table_args__ = (
+        # One wishlist row per (user, product): enforces the invariant the
+        # add route checks for, and serves the user's-list query via its
+        # leftmost prefix so user_id needs no separate index.
+        Index("ix_wishlist_user_product", "user_id", "product_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), index=True, nullable=False)
     target_price = Column(Float, nullable=True)  # User's target price for alerts
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="wishlists")
@@ -0,0 +1,20 @@
+"""Shared schema helpers."""
+
+from pydantic import BaseModel
+
+
+class FastORMModel(BaseModel):
+    """Base for response schemas built straight from trusted ORM rows.
+
+    ``from_orm_fast`` copies the schema's fields off the object with
+    ``model_construct``, skipping the per-field validation pass that
+    ``model_validate`` runs — the rows already came out of the database in
+    the right types. Pair with ``TrustedDataAPIRoute`` so FastAPI does not
+    re-validate the instance on the way out either.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class PriceHistoryBase(BaseModel):
@@ -48,7 +48,10 @@ class PriceHistoryStats(BaseModel):
     max_price: float
     avg_price: float
     current_price: Optional[float] = None
+    price_change: Optional[float] = None
     price_change_pct: Optional[float] = None
+    trend: Optional[str] = None
+    total_records: int = 0
     start_date: datetime
     end_date: datetime
 
@@ -68,3 +71,8 @@ class PriceHistoryChartResponse(BaseModel):
     product_name: str
     data: List[PriceHistoryChartData]
     stats: PriceHistoryStats
+
+
+# Precompiled list validator/serializer, built once at import so the history
+# endpoints can turn a window of rows into JSON bytes in one native pass.
+PRICE_HISTORY_LIST_ADAPTER = TypeAdapter(List[PriceHistoryResponse])
@@ -3,7 +3,9 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from app.schemas.base import FastORMModel
 
 
 class PriceBase(BaseModel):
@@ -22,7 +24,7 @@ class PriceCreate(PriceBase):
     product_id: int
 
 
-class PriceResponse(PriceBase):
+class PriceResponse(PriceBase, FastORMModel):
     """Schema for price response data."""
 
     id: int
@@ -58,7 +60,7 @@ class ProductUpdate(BaseModel):
     image_url: Optional[str] = None
 
 
-class ProductResponse(ProductBase):
+class ProductResponse(ProductBase, FastORMModel):
     """Schema for product response data."""
 
     id: int
@@ -73,6 +75,29 @@ class ProductWithPrices(ProductResponse):
 
     prices: List[PriceResponse] = []
 
+    @classmethod
+    def from_orm_fast(cls, obj):
+        data = {name: getattr(obj, name) for name in cls.model_fields}
+        data["prices"] = [PriceResponse.from_orm_fast(p) for p in data["prices"]]
+        return cls.model_construct(**data)
+
+
+class ProductSummary(BaseModel):
+    """Column-only schema for list views.
+
+    Carries just the fields a listing renders — no description text, no
+    nested prices — so list pages validate from lightweight Row tuples
+    instead of fully hydrated ORM objects.
+    """
+
+    id: int
+    name: str
+    brand: Optional[str] = None
+    category: Optional[str] = None
+    lowest_price: Optional[float] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
 
 class ProductSearchQuery(BaseModel):
     """Schema for product search parameters."""
@@ -85,3 +110,12 @@ class ProductSearchQuery(BaseModel):
     retailer: Optional[str] = None
     page: int = 1
     limit: int = 20
+
+
+# Precompiled list validators/serializers for the hot list endpoints. A
+# module-level TypeAdapter builds its pydantic-core schema once at import;
+# routes can then validate and dump a whole page of rows in a single native
+# pass instead of per-element model construction plus jsonable_encoder.
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+PRODUCT_SUMMARY_LIST_ADAPTER = TypeAdapter(List[ProductSummary])
+PRICE_LIST_ADAPTER = TypeAdapter(List[PriceResponse])
@@ -1,5 +1,5 @@
 """Business logic services."""
 
-from app.services import product, search
+from app.services import price_history, product, search
 
-__all__ = ["product", "search"]
+__all__ = ["price_history", "product", "search"]
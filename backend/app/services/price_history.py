@@ -0,0 +1,34 @@
+"""Price history service helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.price_history import PriceHistory
+
+
+def recorded_since_clause(db: Session, days: int):
+    """
+    Build the "recorded within the last N days" filter for price history.
+
+    On PostgreSQL the cutoff is computed database-side as
+    NOW() - make_interval(days => N), so the planner sees the predicate in
+    terms of NOW() and can prune time partitions if price_history is ever
+    range-partitioned. Other backends bind a Python-computed datetime.
+
+    Args:
+        db: Database session
+        days: Size of the trailing window in days
+
+    Returns:
+        SQLAlchemy filter clause on PriceHistory.recorded_at
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        return PriceHistory.recorded_at >= func.now() - func.make_interval(
+            0, 0, 0, days
+        )
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    return PriceHistory.recorded_at >= cutoff
@@ -2,10 +2,13 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.cache import cached, clear_product_cache
 from app.models.product import Price, Product
 from app.schemas.product import ProductCreate, ProductUpdate
+from app.services.search import ilike_contains
 
 
 def get_product(db: Session, product_id: int) -> Optional[Product]:
@@ -19,41 +22,90 @@ def get_product(db: Session, product_id: int) -> Optional[Product]:
     Returns:
         Product if found, None otherwise
     """
-    return db.query(Product).filter(Product.id == product_id).first()
+    # Core select(): one statement shape with a bound parameter, served from
+    # the engine's compiled-query cache on every call after the first.
+    return db.execute(
+        select(Product).where(Product.id == product_id)
+    ).scalar_one_or_none()
 
 
-def get_products(
+def get_product_with_prices(db: Session, product_id: int) -> Optional[Product]:
+    """
+    Get a product by ID with its prices eagerly loaded.
+
+    Use this variant when the caller reads product.prices: the relationship
+    is populated by a second batched SELECT here rather than a lazy-load at
+    attribute access, which would be an N+1 in a loop (or fail outright
+    after the session closes).
+
+    Args:
+        db: Database session
+        product_id: Product ID
+
+    Returns:
+        Product with prices populated if found, None otherwise
+    """
+    return db.execute(
+        select(Product)
+        .options(selectinload(Product.prices))
+        .where(Product.id == product_id)
+    ).scalar_one_or_none()
+
+
+def product_exists(db: Session, product_id: int) -> bool:
+    """
+    Check whether a product exists without hydrating the full row.
+
+    Args:
+        db: Database session
+        product_id: Product ID
+
+    Returns:
+        True if the product exists, False otherwise
+    """
+    return (
+        db.query(Product.id).filter(Product.id == product_id).scalar() is not None
+    )
+
+
+@cached(ttl_seconds=60)
+def _get_product_ids(
     db: Session,
     skip: int = 0,
     limit: int = 20,
     query: Optional[str] = None,
     category: Optional[str] = None,
     brand: Optional[str] = None,
-) -> List[Product]:
+    after_id: Optional[int] = None,
+) -> List[int]:
     """
-    Get a list of products with optional filtering.
+    Get the matching product ids for a listing page.
+
+    Cached separately from the hydrated rows: an id list is a few dozen
+    bytes in Redis regardless of row width, and pagination UIs re-request
+    the same (query, category, brand, skip, limit) combinations constantly.
 
     Args:
         db: Database session
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when after_id is set)
         limit: Maximum number of records to return
         query: Text search query for name/description
         category: Filter by category
         brand: Filter by brand
+        after_id: Keyset cursor; return ids greater than this value
 
     Returns:
-        List of products
+        List of matching product ids in ascending id order
     """
     from sqlalchemy import or_
 
-    products_query = db.query(Product)
+    products_query = db.query(Product.id)
 
     if query:
-        search_pattern = f"%{query}%"
         products_query = products_query.filter(
             or_(
-                Product.name.ilike(search_pattern),
-                Product.description.ilike(search_pattern),
+                ilike_contains(Product.name, query),
+                ilike_contains(Product.description, query),
             )
         )
 
@@ -63,7 +115,118 @@ def get_products(
     if brand:
         products_query = products_query.filter(Product.brand == brand)
 
-    return products_query.offset(skip).limit(limit).all()
+    # Keyset (seek) pagination when a cursor is given: the index seeks
+    # straight to the page instead of scanning and discarding `skip` rows.
+    products_query = products_query.order_by(Product.id.asc())
+    if after_id is not None:
+        products_query = products_query.filter(Product.id > after_id)
+    else:
+        products_query = products_query.offset(skip)
+
+    return [row[0] for row in products_query.limit(limit)]
+
+
+def get_products(
+    db: Session,
+    skip: int = 0,
+    limit: int = 20,
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    brand: Optional[str] = None,
+    after_id: Optional[int] = None,
+) -> List[Product]:
+    """
+    Get a list of products with optional filtering.
+
+    On a cache hit the filter/scan work is skipped entirely and the rows
+    are rehydrated with one primary-key lookup; products deleted since the
+    ids were cached simply drop out of the page.
+
+    Prefer after_id (the last id of the previous page) over skip for deep
+    pagination: OFFSET scans and discards skipped rows, the cursor seeks.
+
+    Args:
+        db: Database session
+        skip: Number of records to skip (ignored when after_id is set)
+        limit: Maximum number of records to return
+        query: Text search query for name/description
+        category: Filter by category
+        brand: Filter by brand
+        after_id: Keyset cursor; return products with a greater id
+
+    Returns:
+        List of products
+    """
+    ids = _get_product_ids(
+        db,
+        skip=skip,
+        limit=limit,
+        query=query,
+        category=category,
+        brand=brand,
+        after_id=after_id,
+    )
+    if not ids:
+        return []
+
+    products = db.execute(select(Product).where(Product.id.in_(ids))).scalars()
+    by_id = {product.id: product for product in products}
+    return [by_id[pid] for pid in ids if pid in by_id]
+
+
+def list_products_summary(
+    db: Session,
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    brand: Optional[str] = None,
+) -> List:
+    """
+    Get lightweight product rows for list views.
+
+    Selects only the columns a listing renders plus the lowest in-stock
+    price from an aggregate subquery, so the database never ships the
+    description text and the ORM never hydrates (or identity-maps) full
+    Product and Price objects. Detail views should keep using
+    get_product / get_product_with_prices.
+
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        category: Filter by category (contains match)
+        brand: Filter by brand (contains match)
+
+    Returns:
+        List of Row tuples with id, name, brand, category and lowest_price
+        (None when no retailer has the product in stock)
+    """
+    lowest_price = (
+        select(
+            Price.product_id,
+            func.min(Price.price).label("lowest_price"),
+        )
+        .where(Price.in_stock.is_(True))
+        .group_by(Price.product_id)
+        .subquery()
+    )
+
+    stmt = select(
+        Product.id,
+        Product.name,
+        Product.brand,
+        Product.category,
+        lowest_price.c.lowest_price,
+    ).outerjoin(lowest_price, lowest_price.c.product_id == Product.id)
+
+    if category:
+        stmt = stmt.where(ilike_contains(Product.category, category))
+    if brand:
+        stmt = stmt.where(ilike_contains(Product.brand, brand))
+
+    return db.execute(
+        stmt.order_by(Product.id.asc()).offset(skip).limit(limit)
+    ).all()
 
 
 def create_product(db: Session, product_data: ProductCreate) -> Product:
@@ -81,6 +244,7 @@ def create_product(db: Session, product_data: ProductCreate) -> Product:
     db.add(product)
     db.commit()
     db.refresh(product)
+    clear_product_cache()
     return product
 
 
@@ -108,6 +272,7 @@ def update_product(
 
     db.commit()
     db.refresh(product)
+    clear_product_cache()
     return product
 
 
@@ -128,6 +293,7 @@ def delete_product(db: Session, product_id: int) -> bool:
 
     db.delete(product)
     db.commit()
+    clear_product_cache()
     return True
 
 
@@ -142,10 +308,13 @@ def get_product_prices(db: Session, product_id: int) -> List[Price]:
     Returns:
         List of prices for the product
     """
-    product = get_product(db, product_id)
-    if not product:
-        return []
-    return product.prices
+    # Fetch prices directly by product_id: one query instead of hydrating
+    # the product and lazy-loading the relationship. A missing product and
+    # a product with no prices both come back as an empty list, matching
+    # the previous behavior.
+    return db.execute(
+        select(Price).where(Price.product_id == product_id)
+    ).scalars().all()
 
 
 def add_product_price(
@@ -190,6 +359,31 @@ def add_product_price(
     return price_entry
 
 
+def add_product_prices_bulk(db: Session, entries: List[dict]) -> int:
+    """
+    Insert many price entries in one statement and one commit.
+
+    Scrapers calling add_product_price in a loop pay a commit (fsync/WAL
+    flush) per row; this batches the whole scrape result into a single
+    executemany INSERT. Entries are dicts with the Price column names
+    (product_id, retailer, price, and optionally currency/url/in_stock).
+    Batches large enough for INSERT parsing itself to matter should switch
+    to COPY via the raw psycopg connection.
+
+    Args:
+        db: Database session
+        entries: Price rows as column-name dicts
+
+    Returns:
+        Number of rows inserted
+    """
+    if not entries:
+        return 0
+    db.execute(insert(Price), entries)
+    db.commit()
+    return len(entries)
+
+
 def get_lowest_price(db: Session, product_id: int) -> Optional[Price]:
     """
     Get the lowest current price for a product.
@@ -201,12 +395,12 @@ def get_lowest_price(db: Session, product_id: int) -> Optional[Price]:
     Returns:
         Lowest price entry if available, None otherwise
     """
-    return (
-        db.query(Price)
-        .filter(Price.product_id == product_id, Price.in_stock.is_(True))
+    return db.execute(
+        select(Price)
+        .where(Price.product_id == product_id, Price.in_stock.is_(True))
         .order_by(Price.price.asc())
-        .first()
-    )
+        .limit(1)
+    ).scalar_one_or_none()
 
 
 def get_products_by_category(
@@ -226,7 +420,7 @@ def get_products_by_category(
     """
     return (
         db.query(Product)
-        .filter(Product.category.ilike(f"%{category}%"))
+        .filter(ilike_contains(Product.category, category))
         .offset(skip)
         .limit(limit)
         .all()
@@ -250,7 +444,7 @@ def get_products_by_brand(
     """
     return (
         db.query(Product)
-        .filter(Product.brand.ilike(f"%{brand}%"))
+        .filter(ilike_contains(Product.brand, brand))
         .offset(skip)
         .limit(limit)
         .all()
@@ -271,17 +465,24 @@ def get_in_stock_products(
     Returns:
         List of in-stock products
     """
+    # Correlated EXISTS instead of join+DISTINCT: the planner probes for one
+    # matching price per product and can push the LIMIT down, rather than
+    # materializing and de-duplicating the whole joined set first.
+    in_stock_exists = (
+        db.query(Price)
+        .filter(Price.product_id == Product.id, Price.in_stock.is_(True))
+        .exists()
+    )
     return (
         db.query(Product)
-        .join(Price)
-        .filter(Price.in_stock.is_(True))
-        .distinct()
+        .filter(in_stock_exists)
         .offset(skip)
         .limit(limit)
         .all()
     )
 
 
+@cached(ttl_seconds=60)
 def count_products(
     db: Session,
     query: Optional[str] = None,
@@ -298,18 +499,24 @@ def count_products(
         brand: Filter by brand
 
     Returns:
-        Number of matching products
+        Number of matching products (approximate when unfiltered; see
+        estimated_count)
     """
-    from sqlalchemy import func, or_
+    from sqlalchemy import or_
+
+    # Unfiltered totals only feed pagination UI, where the planner's
+    # estimate is indistinguishable from an exact count — and O(1) instead
+    # of a full scan on every first page load.
+    if query is None and category is None and brand is None:
+        return estimated_count(db)
 
     products_query = db.query(func.count(Product.id))
 
     if query:
-        search_pattern = f"%{query}%"
         products_query = products_query.filter(
             or_(
-                Product.name.ilike(search_pattern),
-                Product.description.ilike(search_pattern),
+                ilike_contains(Product.name, query),
+                ilike_contains(Product.description, query),
             )
         )
 
@@ -320,3 +527,30 @@ def count_products(
         products_query = products_query.filter(Product.brand == brand)
 
     return products_query.scalar()
+
+
+def estimated_count(db: Session, model=Product) -> int:
+    """
+    Get a fast approximate row count for pagination totals.
+
+    On PostgreSQL this reads the planner's reltuples estimate instead of
+    scanning the table, which is what an unfiltered SELECT COUNT(*) would
+    cost. Other backends fall back to the exact count.
+
+    Args:
+        db: Database session
+        model: Mapped model whose table to estimate (default: Product)
+
+    Returns:
+        Approximate number of rows in the model's table
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :t"),
+            {"t": model.__tablename__},
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    return db.query(func.count(model.id)).scalar()
@@ -1,14 +1,126 @@
 """Search service for location-based filtering and product search."""
 
 import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import or_
+import numpy as np
+
+from sqlalchemy import and_, func, literal_column, or_, select
 from sqlalchemy.orm import Session
 
+from app.core.cache import cached
 from app.models.product import Price, Product
 
 
+def ilike_contains(column, query: str):
+    """
+    Build a contains-style ILIKE clause for a column.
+
+    One place constructs the %query% pattern instead of every call site;
+    the pattern rides a bound parameter, so the compiled statement (and its
+    query-cache entry) is shared across requests regardless of the query
+    text, and on PostgreSQL the trigram indexes serve the scan.
+
+    Args:
+        column: Column to match against
+        query: Raw user query (unwildcarded)
+
+    Returns:
+        SQLAlchemy ILIKE clause
+    """
+    return column.ilike(f"%{query}%")
+
+
+def product_text_search_clause(db: Session, query: str):
+    """
+    Build the text-search filter clause for products.
+
+    On PostgreSQL this matches the stored search_tsv column (weighted
+    tsvector generated from name/brand/description, GIN-indexed by the
+    migrations) via plainto_tsquery, instead of an unindexable
+    leading-wildcard ILIKE scan. On other backends (e.g. SQLite in tests)
+    it falls back to the ILIKE pattern match.
+
+    Args:
+        db: Database session
+        query: Text search query
+
+    Returns:
+        SQLAlchemy filter clause matching products by name/description/brand
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        # search_tsv exists only on PostgreSQL (added by migration), so it is
+        # referenced by name rather than mapped on the model.
+        return literal_column("products.search_tsv").op("@@")(
+            func.plainto_tsquery("english", query)
+        )
+
+    # Analyze the pattern before building it (optimizer-style rewrite):
+    # a query that is nothing but wildcards matches everything, so skip the
+    # pattern machinery entirely; a query with explicit wildcards is taken
+    # as-is, letting anchored patterns like 'Apple%' hit the lower(name)
+    # index instead of being double-wrapped into a contains scan.
+    if "%" in query or "_" in query:
+        if not query.replace("%", ""):
+            return Product.name.isnot(None)
+        search_pattern = query
+    else:
+        search_pattern = f"%{query}%"
+    return or_(
+        Product.name.ilike(search_pattern),
+        Product.description.ilike(search_pattern),
+        Product.brand.ilike(search_pattern),
+    )
+
+
+def product_text_search_rank(db: Session, query: str):
+    """
+    Build a relevance ordering expression for a text search, if available.
+
+    On PostgreSQL this is ts_rank_cd over the stored search_tsv column, so
+    name matches (weight A) sort ahead of brand (B) and description (C)
+    matches. Backends without full-text search return None and callers keep
+    their default ordering.
+
+    Args:
+        db: Database session
+        query: Text search query
+
+    Returns:
+        SQLAlchemy ordering expression, or None when unranked
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        return func.ts_rank_cd(
+            literal_column("products.search_tsv"),
+            func.plainto_tsquery("english", query),
+        )
+    return None
+
+
+def product_fuzzy_name_clause(db: Session, query: str):
+    """
+    Build a typo-tolerant name match clause.
+
+    On PostgreSQL this is the pg_trgm similarity operator (%), served by the
+    trigram GIN index on name, so 'saxaphone' still finds saxophones. Other
+    backends have no similarity support and fall back to a contains ILIKE.
+
+    Args:
+        db: Database session
+        query: Approximate product name
+
+    Returns:
+        SQLAlchemy filter clause matching products by similar name
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        return Product.name.op("%")(query)
+    return ilike_contains(Product.name, query)
+
+
 # Sample US Zip code to coordinates mapping for demonstration purposes.
 # PRODUCTION NOTE: Replace this with a geocoding API (Google Maps, OpenStreetMap Nominatim,
 # or a dedicated zip code database like USPS or commercial providers) for comprehensive
@@ -32,6 +144,16 @@ ZIP_CODE_COORDS: Dict[str, Tuple[float, float]] = {
     "83702": (43.6150, -116.2023),  # Boise, ID
 }
 
+# Structure-of-arrays view of the zip table, built once at import: parallel
+# coordinate arrays let radius queries run as one vectorized pass over every
+# zip (see zips_within_radius) instead of a Python loop, which matters once
+# the table is the full ~40k US zips rather than this sample. The dict above
+# stays the human-editable source of truth.
+_ZIPS = tuple(ZIP_CODE_COORDS)
+_LATS = np.array([c[0] for c in ZIP_CODE_COORDS.values()], dtype=np.float64)
+_LONS = np.array([c[1] for c in ZIP_CODE_COORDS.values()], dtype=np.float64)
+_ZIP_TO_IDX = {zip_code: idx for idx, zip_code in enumerate(_ZIPS)}
+
 
 def haversine_distance(
     lat1: float, lon1: float, lat2: float, lon2: float
@@ -39,6 +161,14 @@ def haversine_distance(
     """
     Calculate the great-circle distance between two points on Earth.
 
+    Kept as plain math on purpose: single-pair calls are dominated by call
+    overhead either way, and bulk filtering goes through the vectorized
+    haversine_distance_batch. A numba @njit build of this function was
+    considered and rejected — it would add a compiler toolchain to the
+    image and per-worker JIT warmup for a function that is not in any hot
+    loop. Revisit only if profiling ever shows scalar haversine calls in a
+    tight per-request loop.
+
     Args:
         lat1: Latitude of first point in degrees
         lon1: Longitude of first point in degrees
@@ -67,10 +197,52 @@ def haversine_distance(
     return earth_radius * c
 
 
+def haversine_distance_batch(
+    lat1: float, lon1: float, lats2, lons2
+) -> "np.ndarray":
+    """
+    Calculate great-circle distances from one point to many points at once.
+
+    Vectorized counterpart to haversine_distance for bulk filtering (e.g.
+    every retailer within a radius): NumPy evaluates the trig over whole
+    arrays in compiled loops, so the cost per point is a fraction of the
+    scalar version's. For a single pair, the scalar function is faster —
+    array setup outweighs the math at length 1.
+
+    Args:
+        lat1: Latitude of the origin point in degrees
+        lon1: Longitude of the origin point in degrees
+        lats2: Array-like of destination latitudes in degrees
+        lons2: Array-like of destination longitudes in degrees
+
+    Returns:
+        Array of distances in miles, one per destination point
+    """
+    earth_radius = 3959
+
+    lat1_rad = math.radians(lat1)
+    lats2_rad = np.radians(np.asarray(lats2, dtype=np.float64))
+    delta_lat = lats2_rad - lat1_rad
+    delta_lon = np.radians(np.asarray(lons2, dtype=np.float64) - lon1)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + math.cos(lat1_rad) * np.cos(lats2_rad) * np.sin(delta_lon / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return earth_radius * c
+
+
+@lru_cache(maxsize=65536)
 def zip_to_coordinates(zip_code: str) -> Optional[Tuple[float, float]]:
     """
     Convert a zip code to latitude/longitude coordinates.
 
+    Results are memoized in-process; the mapping is static for the life of
+    the application. The cache keys on the raw argument, so repeat lookups
+    of a hot zip skip even the strip/slice normalization below.
+
     Args:
         zip_code: US 5-digit zip code
 
@@ -79,7 +251,29 @@ def zip_to_coordinates(zip_code: str) -> Optional[Tuple[float, float]]:
     """
     # Normalize zip code (remove any extra characters)
     normalized_zip = zip_code.strip()[:5]
-    return ZIP_CODE_COORDS.get(normalized_zip)
+    idx = _ZIP_TO_IDX.get(normalized_zip)
+    if idx is None:
+        return None
+    return (float(_LATS[idx]), float(_LONS[idx]))
+
+
+def zips_within_radius(lat: float, lon: float, radius_miles: float) -> List[str]:
+    """
+    Find all known zip codes within a radius of a point.
+
+    One vectorized haversine pass over the whole coordinate table, so the
+    cost stays flat as the zip table grows — no per-zip Python calls.
+
+    Args:
+        lat: Center latitude in degrees
+        lon: Center longitude in degrees
+        radius_miles: Radius in miles
+
+    Returns:
+        List of zip codes whose centroid lies within the radius
+    """
+    mask = haversine_distance_batch(lat, lon, _LATS, _LONS) <= radius_miles
+    return [zip_code for zip_code, hit in zip(_ZIPS, mask) if hit]
 
 
 def coordinates_to_bounding_box(
@@ -122,10 +316,16 @@ def search_products_by_text(
     in_stock: Optional[bool] = None,
     page: int = 1,
     limit: int = 20,
+    after_id: Optional[int] = None,
 ) -> List[Product]:
     """
     Search products with various filters.
 
+    Prefer after_id (the last id of the previous page) over page for deep
+    pagination; the cursor path seeks on the primary key instead of
+    scanning and discarding OFFSET rows, at the cost of id ordering
+    instead of relevance ordering.
+
     Args:
         db: Database session
         query: Text search query for name/description/brand
@@ -135,53 +335,92 @@ def search_products_by_text(
         max_price: Maximum price filter
         retailer: Filter by retailer name
         in_stock: Filter by stock availability
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when after_id is set)
         limit: Results per page
+        after_id: Keyset cursor; return products with a greater id
 
     Returns:
         List of matching products
     """
     products_query = db.query(Product)
 
-    # Text search on name, description, and brand
+    # Text search on name, description, and brand: the weighted search_tsv
+    # GIN probe on PostgreSQL, ILIKE fallback elsewhere.
     if query:
-        search_pattern = f"%{query}%"
         products_query = products_query.filter(
-            or_(
-                Product.name.ilike(search_pattern),
-                Product.description.ilike(search_pattern),
-                Product.brand.ilike(search_pattern),
-            )
+            product_text_search_clause(db, query)
         )
 
     # Filter by category
     if category:
-        products_query = products_query.filter(Product.category.ilike(f"%{category}%"))
+        products_query = products_query.filter(ilike_contains(Product.category, category))
 
     # Filter by brand
     if brand:
-        products_query = products_query.filter(Product.brand.ilike(f"%{brand}%"))
-
-    # Filter by price range and retailer (requires joining with prices table)
+        products_query = products_query.filter(ilike_contains(Product.brand, brand))
+
+    # Filter on the price side. Two shapes depending on selectivity:
+    #
+    # - A single condition (typically in-stock-only) is barely selective,
+    #   so a correlated EXISTS probe per product wins — it stops at the
+    #   first matching price and never builds an intermediate set.
+    # - Multiple conditions together are selective; narrowing prices once
+    #   in a DISTINCT-product_id CTE and joining Product to it lets the
+    #   planner scan the (smaller) filtered price set a single time instead
+    #   of re-probing it per candidate product. The DISTINCT lives on the
+    #   CTE, so the join cannot duplicate Product rows and the rank
+    #   ordering below stays valid.
     if min_price is not None or max_price is not None or retailer or in_stock is not None:
-        products_query = products_query.join(Price)
+        price_conditions = []
 
         if min_price is not None:
-            products_query = products_query.filter(Price.price >= min_price)
+            price_conditions.append(Price.price >= min_price)
 
         if max_price is not None:
-            products_query = products_query.filter(Price.price <= max_price)
+            price_conditions.append(Price.price <= max_price)
 
         if retailer:
-            products_query = products_query.filter(Price.retailer.ilike(f"%{retailer}%"))
+            price_conditions.append(ilike_contains(Price.retailer, retailer))
 
         if in_stock is not None:
-            products_query = products_query.filter(Price.in_stock == in_stock)
+            price_conditions.append(Price.in_stock == in_stock)
+
+        if len(price_conditions) > 1:
+            matching_prices = (
+                select(Price.product_id)
+                .where(and_(*price_conditions))
+                .distinct()
+                .cte("matching_prices")
+            )
+            products_query = products_query.join(
+                matching_prices, Product.id == matching_prices.c.product_id
+            )
+        else:
+            products_query = products_query.filter(
+                db.query(Price)
+                .filter(Price.product_id == Product.id, *price_conditions)
+                .exists()
+            )
 
-        # Remove duplicates from join
-        products_query = products_query.distinct()
+    # Pagination: keyset cursor seeks on the primary key; the page path
+    # keeps relevance ordering when ranking is available.
+    if after_id is not None:
+        products = (
+            products_query.filter(Product.id > after_id)
+            .order_by(Product.id.asc())
+            .limit(limit)
+            .all()
+        )
+        return products
+
+    if query:
+        # Ranked ordering so name matches (weight A) sort ahead of brand and
+        # description matches. Safe alongside the EXISTS filter, which adds
+        # no DISTINCT to conflict with the ORDER BY expression.
+        rank = product_text_search_rank(db, query)
+        if rank is not None:
+            products_query = products_query.order_by(rank.desc())
 
-    # Pagination
     offset = (page - 1) * limit
     products = products_query.offset(offset).limit(limit).all()
 
@@ -213,6 +452,13 @@ def search_products_by_location(
     and can be used to extend this functionality in production. The zip_to_coordinates
     and haversine_distance helper functions are available for distance calculations.
 
+    PRODUCTION NOTE: when retailer locations land, do the radius filtering in the
+    database rather than with haversine_distance in Python: store a
+    geography(Point, 4326) column, add a GiST index, and filter with
+    ST_DWithin(location, ST_MakePoint(lon, lat)::geography, radius_miles * 1609.34)
+    so the R-tree returns only candidate rows (PostGIS; keep a bounding-box
+    prefilter via coordinates_to_bounding_box as the non-PostGIS fallback).
+
     Args:
         db: Database session
         zip_code: US zip code for location center (converted to lat/lon internally)
@@ -249,7 +495,7 @@ def search_products_by_location(
         )
 
     if category:
-        products_query = products_query.filter(Product.category.ilike(f"%{category}%"))
+        products_query = products_query.filter(ilike_contains(Product.category, category))
 
     # Pagination
     offset = (page - 1) * limit
@@ -258,8 +504,9 @@ def search_products_by_location(
     return products
 
 
+@cached(ttl_seconds=60)
 def get_search_suggestions(
-    db: Session, query: str, limit: int = 10
+    db: Session, query: str, limit: int = 10, contains: bool = False
 ) -> List[str]:
     """
     Get search suggestions based on product names.
@@ -268,16 +515,25 @@ def get_search_suggestions(
         db: Database session
         query: Partial search query
         limit: Maximum number of suggestions
+        contains: Match the query anywhere in the name instead of as a prefix
 
     Returns:
         List of product name suggestions
     """
-    search_pattern = f"%{query}%"
+    # Anchored prefix match on lower(name) so the functional index on
+    # lower(name) can serve typeahead lookups instead of a full scan. The
+    # contains flag opts back into the unanchored (and unindexed on SQLite;
+    # trigram-indexed on Postgres) substring match.
+    if contains:
+        name_filter = ilike_contains(Product.name, query)
+    else:
+        name_filter = func.lower(Product.name).like(f"{query.lower()}%")
 
     products = (
         db.query(Product.name)
-        .filter(Product.name.ilike(search_pattern))
+        .filter(name_filter)
         .distinct()
+        .order_by(Product.name)
         .limit(limit)
         .all()
     )
@@ -291,33 +547,77 @@ def get_deals(
     max_price: Optional[float] = None,
     page: int = 1,
     limit: int = 20,
+    after_price: Optional[float] = None,
+    after_id: Optional[int] = None,
 ) -> List[Product]:
     """
     Find products with the best deals (lowest prices, in stock).
 
+    Prefer the (after_price, after_id) cursor — the lowest price and id of
+    the previous page's last product — over page for deep pagination: the
+    row-value comparison seeks on the (product_id, price) index instead of
+    scanning and discarding OFFSET rows.
+
     Args:
         db: Database session
         category: Filter by category
         max_price: Maximum price filter
-        page: Page number
+        page: Page number (ignored when the cursor is set)
         limit: Results per page
+        after_price: Keyset cursor, price component
+        after_id: Keyset cursor, product id component (tie-breaker)
 
     Returns:
         List of products ordered by lowest price
     """
-    products_query = db.query(Product).join(Price).filter(Price.in_stock.is_(True))
+    # Rank each product's in-stock prices and keep only the cheapest
+    # (rn = 1): one window pass instead of DISTINCT over the whole join,
+    # and the result carries the lowest price so the ordering and the
+    # max_price filter both apply to the price that is actually shown.
+    ranked_prices = (
+        select(
+            Price.product_id,
+            Price.price,
+            func.row_number()
+            .over(partition_by=Price.product_id, order_by=Price.price.asc())
+            .label("rn"),
+        )
+        .where(Price.in_stock.is_(True))
+        .subquery()
+    )
+
+    products_query = (
+        db.query(Product)
+        .join(ranked_prices, ranked_prices.c.product_id == Product.id)
+        .filter(ranked_prices.c.rn == 1)
+    )
 
     if category:
-        products_query = products_query.filter(Product.category.ilike(f"%{category}%"))
+        products_query = products_query.filter(ilike_contains(Product.category, category))
 
     if max_price is not None:
-        products_query = products_query.filter(Price.price <= max_price)
+        products_query = products_query.filter(ranked_prices.c.price <= max_price)
 
-    # Order by lowest price
-    products_query = products_query.order_by(Price.price.asc()).distinct()
+    # Order by lowest price, product id breaking ties so the cursor is
+    # unambiguous.
+    products_query = products_query.order_by(
+        ranked_prices.c.price.asc(), Product.id.asc()
+    )
 
-    # Pagination
-    offset = (page - 1) * limit
-    products = products_query.offset(offset).limit(limit).all()
+    # Pagination: keyset when the cursor is given, offset as fallback.
+    if after_price is not None and after_id is not None:
+        products_query = products_query.filter(
+            or_(
+                ranked_prices.c.price > after_price,
+                and_(
+                    ranked_prices.c.price == after_price,
+                    Product.id > after_id,
+                ),
+            )
+        )
+    else:
+        products_query = products_query.offset((page - 1) * limit)
+
+    products = products_query.limit(limit).all()
 
     return products
@@ -15,7 +15,31 @@ celery_app = Celery(
     include=["celery_app.tasks"],
 )
 
-# Configure Celery
+# Configure Celery.
+#
+# worker_prefetch_multiplier here is a floor tuned for the long-running
+# maintenance tasks, where prefetching a second task just holds it hostage
+# behind a slow one. The scraping queue is the opposite case — many short
+# HTTP-bound tasks whose broker round-trip dominates — so run it on a
+# dedicated worker with a higher prefetch to hide that latency:
+#
+#   celery -A celery_app worker -Q scraping --prefetch-multiplier=8
+#   celery -A celery_app worker -Q maintenance,alerts,default
+#
+# Prefetch is a per-worker setting in Celery, not per-queue, hence the
+# split at worker-launch level. task_acks_late is already on, so prefetched
+# scrape tasks are redelivered if a worker dies mid-batch.
+#
+# The scraping worker should also run a green-thread pool: its tasks sit in
+# HTTP/DB wait, so prefork burns a whole OS process per in-flight request.
+# Launch it with
+#
+#   celery -A celery_app worker -Q scraping -P gevent -c 100 --prefetch-multiplier=8
+#
+# (-P gevent monkey-patches the worker at startup, making requests and
+# psycopg2-via-psycogreen cooperative). Keep the maintenance/alerts worker
+# on the default prefork pool — its tasks are DB/CPU bound batch jobs that
+# gain nothing from green threads.
 celery_app.conf.update(
     task_serializer=settings.task_serializer,
     result_serializer=settings.result_serializer,
@@ -25,6 +49,16 @@ celery_app.conf.update(
     task_acks_late=settings.task_acks_late,
     task_reject_on_worker_lost=settings.task_reject_on_worker_lost,
     worker_prefetch_multiplier=settings.worker_prefetch_multiplier,
+    result_expires=settings.result_expires,
+    # With acks_late, Redis redelivers an unacked task after the visibility
+    # timeout; keep it comfortably above the longest task run (a full
+    # scrape cycle) so slow-but-alive tasks are not delivered twice.
+    broker_transport_options={
+        "visibility_timeout": max(3600, settings.price_scrape_interval * 2),
+    },
+    # Prefix result keys so `redis-cli --scan --pattern "shopper:*"` can
+    # inspect them on a shared Redis.
+    result_backend_transport_options={"global_keyprefix": "shopper:"},
 )
 
 # Configure periodic tasks (Celery Beat)
@@ -44,6 +78,11 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=2, minute=0),  # Run at 2 AM UTC
         "options": {"queue": "maintenance"},
     },
+    "rollup-price-history-daily": {
+        "task": "celery_app.tasks.rollup_price_history_daily",
+        "schedule": crontab(hour=1, minute=0),  # Run at 1 AM UTC, before cleanup
+        "options": {"queue": "maintenance"},
+    },
 }
 
 # Define task queues
@@ -13,10 +13,13 @@ class CelerySettings(BaseSettings):
     broker_url: str = "redis://localhost:6379/0"
     result_backend: str = "redis://localhost:6379/0"
 
-    # Task settings
-    task_serializer: str = "json"
-    result_serializer: str = "json"
-    accept_content: List[str] = ["json"]
+    # Task settings. msgpack encodes the scrape payloads (lists of prices
+    # and URLs) faster and smaller than JSON, cutting broker CPU and Redis
+    # memory; json stays accepted so in-flight tasks from older deploys
+    # still drain during a rollout.
+    task_serializer: str = "msgpack"
+    result_serializer: str = "msgpack"
+    accept_content: List[str] = ["msgpack", "json"]
     timezone: str = "UTC"
     enable_utc: bool = True
 
@@ -25,6 +28,18 @@ class CelerySettings(BaseSettings):
     task_reject_on_worker_lost: bool = True
     worker_prefetch_multiplier: int = 1
 
+    # Result lifetime in Redis. Without an expiry, result keys accumulate
+    # until they bloat broker memory; an hour is plenty for anything that
+    # polls a task.
+    result_expires: int = 3600
+
+    # Database pool settings. Each worker process runs one task at a time,
+    # so a couple of connections per worker is plenty; the API keeps its own
+    # larger pool. Bounding this keeps a fleet of workers from starving the
+    # server of connections under burst load.
+    db_pool_size: int = 2
+    db_max_overflow: int = 2
+
     # Schedule settings (in seconds)
     price_scrape_interval: int = 3600  # 1 hour
     alert_check_interval: int = 300  # 5 minutes
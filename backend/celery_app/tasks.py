@@ -4,12 +4,13 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from celery import shared_task
-from sqlalchemy import create_engine, func
+from celery import group, shared_task
+from celery.signals import worker_process_init
+from sqlalchemy import case, create_engine, func, insert, select
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
-from app.models.price_history import PriceHistory
+from app.models.price_history import PriceHistory, PriceHistoryDaily
 from app.models.product import Price, Product
 from app.models.wishlist import WishlistItem
 from celery_app.config import get_celery_settings
@@ -20,15 +21,39 @@ logger = logging.getLogger(__name__)
 app_settings = get_settings()
 celery_settings = get_celery_settings()
 
-engine = create_engine(
-    app_settings.database_url,
-    connect_args={"check_same_thread": False}
-    if app_settings.database_url.startswith("sqlite")
-    else {},
-)
+if app_settings.database_url.startswith("sqlite"):
+    engine = create_engine(
+        app_settings.database_url,
+        connect_args={"check_same_thread": False},
+    )
+else:
+    # Small bounded pool per worker process (tasks run one at a time),
+    # pre-pinged and recycled like the API engine so long-idle workers do
+    # not hand tasks a dead connection.
+    engine = create_engine(
+        app_settings.database_url,
+        pool_size=celery_settings.db_pool_size,
+        max_overflow=celery_settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@worker_process_init.connect
+def _reset_engine_after_fork(**kwargs):
+    """Drop pooled connections inherited from the parent worker process.
+
+    The prefork pool imports this module (and builds the engine) in the
+    parent before forking; without this, child processes would share the
+    parent's sockets and corrupt each other's result streams. close=False
+    discards the inherited connections without closing them out from under
+    the parent, and each child then opens its own on first use.
+    """
+    engine.dispose(close=False)
+
+
 def get_db():
     """Get database session for Celery tasks."""
     db = SessionLocal()
@@ -38,7 +63,10 @@ def get_db():
         db.close()
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+# queue="scraping" on the network-bound tasks so ad-hoc .delay()/group
+# publishes land on the scraping queue (and its green-thread worker) even
+# without the beat schedule's routing options.
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, queue="scraping")
 def scrape_product_prices(self, product_id: int) -> dict:
     """Scrape prices for a specific product from all retailers.
 
@@ -55,22 +83,19 @@ def scrape_product_prices(self, product_id: int) -> dict:
             logger.warning(f"Product {product_id} not found")
             return {"status": "error", "message": "Product not found"}
 
-        # Get current prices and store in history
-        current_prices = db.query(Price).filter(Price.product_id == product_id).all()
-
-        prices_stored = 0
-        for price in current_prices:
-            # Store price in history
-            history_entry = PriceHistory(
-                product_id=product_id,
-                retailer=price.retailer,
-                price=price.price,
-                currency=price.currency,
+        # Snapshot current prices into history with one server-side
+        # INSERT ... SELECT: the rows never travel to Python, and the
+        # unit of work has no per-row ORM objects to flush.
+        result = db.execute(
+            insert(PriceHistory).from_select(
+                ["product_id", "retailer", "price", "currency"],
+                select(
+                    Price.product_id, Price.retailer, Price.price, Price.currency
+                ).where(Price.product_id == product_id),
             )
-            db.add(history_entry)
-            prices_stored += 1
-
+        )
         db.commit()
+        prices_stored = result.rowcount
 
         logger.info(f"Stored {prices_stored} price entries for product {product_id}")
         return {
@@ -107,9 +132,14 @@ def scrape_all_prices(self) -> dict:
         product_ids = [p.id for p in products_with_prices]
         logger.info(f"Starting price scrape for {len(product_ids)} products")
 
-        # Queue individual scrape tasks for each product
-        for product_id in product_ids:
-            scrape_product_prices.delay(product_id)
+        # Queue all scrape tasks as one group: the Redis broker pushes the
+        # messages through a single pipeline instead of paying one
+        # round-trip per .delay() call.
+        if product_ids:
+            group(
+                scrape_product_prices.s(product_id)
+                for product_id in product_ids
+            ).apply_async()
 
         return {
             "status": "success",
@@ -123,7 +153,7 @@ def scrape_all_prices(self) -> dict:
         db.close()
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, queue="scraping")
 def store_price_history(
     self, product_id: int, retailer: str, price: float, currency: str = "USD"
 ) -> dict:
@@ -181,35 +211,47 @@ def check_price_alerts(self) -> dict:
     """
     db = SessionLocal()
     try:
-        # Get all wishlist items with target prices
-        wishlist_items = (
-            db.query(WishlistItem)
+        # One aggregate query instead of a MIN(price) round-trip per
+        # wishlist row: join the items to per-product lowest prices and let
+        # the database return only the rows whose target is met.
+        items_checked = (
+            db.query(func.count(WishlistItem.id))
             .filter(WishlistItem.target_price.isnot(None))
-            .all()
+            .scalar()
         )
 
-        alerts_triggered = 0
-        items_checked = 0
-
-        for item in wishlist_items:
-            items_checked += 1
-
-            # Get the lowest current price for this product
-            lowest_price = (
-                db.query(func.min(Price.price))
-                .filter(Price.product_id == item.product_id)
-                .scalar()
+        min_prices = (
+            select(
+                Price.product_id,
+                func.min(Price.price).label("min_price"),
+            )
+            .group_by(Price.product_id)
+            .subquery()
+        )
+        triggered = (
+            db.query(
+                WishlistItem.user_id,
+                WishlistItem.product_id,
+                WishlistItem.target_price,
+                min_prices.c.min_price,
             )
+            .join(min_prices, min_prices.c.product_id == WishlistItem.product_id)
+            .filter(
+                WishlistItem.target_price.isnot(None),
+                min_prices.c.min_price <= WishlistItem.target_price,
+            )
+            .all()
+        )
 
-            if lowest_price is not None and lowest_price <= item.target_price:
-                alerts_triggered += 1
-                logger.info(
-                    f"Price alert triggered: user={item.user_id}, "
-                    f"product={item.product_id}, "
-                    f"target={item.target_price}, current={lowest_price}"
-                )
-                # In a real implementation, this would trigger a notification
-                # (email, push notification, etc.)
+        alerts_triggered = len(triggered)
+        for user_id, product_id, target_price, min_price in triggered:
+            logger.info(
+                f"Price alert triggered: user={user_id}, "
+                f"product={product_id}, "
+                f"target={target_price}, current={min_price}"
+            )
+            # In a real implementation, this would trigger a notification
+            # (email, push notification, etc.)
 
         logger.info(
             f"Price alert check complete: {items_checked} items checked, "
@@ -241,17 +283,19 @@ def check_single_product_alert(self, product_id: int) -> dict:
     """
     db = SessionLocal()
     try:
-        # Get wishlist items for this product with target prices
-        wishlist_items = (
-            db.query(WishlistItem)
+        # Most products have no subscribers, so probe for one wishlist row
+        # first and skip the MIN(price) aggregate entirely when there are
+        # none — this task runs after every scrape.
+        has_subscribers = (
+            db.query(WishlistItem.id)
             .filter(
                 WishlistItem.product_id == product_id,
                 WishlistItem.target_price.isnot(None),
             )
-            .all()
+            .limit(1)
+            .scalar()
         )
-
-        if not wishlist_items:
+        if has_subscribers is None:
             return {"status": "success", "alerts_triggered": 0}
 
         # Get the lowest current price
@@ -262,12 +306,22 @@ def check_single_product_alert(self, product_id: int) -> dict:
         )
 
         alerts_triggered = 0
-        for item in wishlist_items:
-            if lowest_price is not None and lowest_price <= item.target_price:
-                alerts_triggered += 1
+        if lowest_price is not None:
+            # Fetch only the rows whose target is met instead of filtering
+            # the full subscriber list in Python.
+            triggered = (
+                db.query(WishlistItem.user_id, WishlistItem.target_price)
+                .filter(
+                    WishlistItem.product_id == product_id,
+                    WishlistItem.target_price >= lowest_price,
+                )
+                .all()
+            )
+            alerts_triggered = len(triggered)
+            for user_id, target_price in triggered:
                 logger.info(
-                    f"Price alert: user={item.user_id}, product={product_id}, "
-                    f"target={item.target_price}, current={lowest_price}"
+                    f"Price alert: user={user_id}, product={product_id}, "
+                    f"target={target_price}, current={lowest_price}"
                 )
 
         return {
@@ -283,6 +337,108 @@ def check_single_product_alert(self, product_id: int) -> dict:
         db.close()
 
 
+@shared_task(bind=True, max_retries=1)
+def rollup_price_history_daily(self, days_back: int = 2) -> dict:
+    """Roll up raw price history into per-day aggregates.
+
+    Recomputes the last ``days_back`` days so late-arriving entries are
+    folded in, and inserts the aggregates server-side with a single
+    INSERT ... SELECT.
+
+    Args:
+        days_back: Number of trailing days to (re)compute
+
+    Returns:
+        Dictionary with rollup results
+    """
+    db = SessionLocal()
+    try:
+        cutoff_day = (
+            datetime.now(timezone.utc) - timedelta(days=days_back)
+        ).date()
+        day_expr = func.date(PriceHistory.recorded_at)
+
+        # Replace the trailing window wholesale; rows are few (<= days_back
+        # per product/retailer) so delete + reinsert stays cheap.
+        deleted = (
+            db.query(PriceHistoryDaily)
+            .filter(PriceHistoryDaily.day >= cutoff_day)
+            .delete()
+        )
+
+        # Rank entries within each (product, day, retailer) group from both
+        # ends so the aggregate can pick out opening and closing prices.
+        group_cols = (PriceHistory.product_id, day_expr, PriceHistory.retailer)
+        ranked = (
+            db.query(
+                PriceHistory.product_id.label("product_id"),
+                day_expr.label("day"),
+                PriceHistory.retailer.label("retailer"),
+                PriceHistory.price.label("price"),
+                func.row_number()
+                .over(partition_by=group_cols, order_by=PriceHistory.recorded_at.asc())
+                .label("rn_asc"),
+                func.row_number()
+                .over(partition_by=group_cols, order_by=PriceHistory.recorded_at.desc())
+                .label("rn_desc"),
+            )
+            .filter(day_expr >= cutoff_day)
+            .subquery()
+        )
+
+        rollup_select = (
+            db.query(
+                ranked.c.product_id,
+                ranked.c.day,
+                ranked.c.retailer,
+                func.min(ranked.c.price),
+                func.max(ranked.c.price),
+                func.avg(ranked.c.price),
+                func.count(ranked.c.price),
+                func.max(case((ranked.c.rn_asc == 1, ranked.c.price))),
+                func.max(case((ranked.c.rn_desc == 1, ranked.c.price))),
+            )
+            .group_by(ranked.c.product_id, ranked.c.day, ranked.c.retailer)
+            .statement
+        )
+
+        db.execute(
+            insert(PriceHistoryDaily).from_select(
+                [
+                    "product_id",
+                    "day",
+                    "retailer",
+                    "min_price",
+                    "max_price",
+                    "avg_price",
+                    "count",
+                    "first_price",
+                    "last_price",
+                ],
+                rollup_select,
+            )
+        )
+        db.commit()
+
+        logger.info(
+            f"Price history rollup complete: recomputed days >= {cutoff_day}, "
+            f"replaced {deleted} rows"
+        )
+
+        return {
+            "status": "success",
+            "cutoff_day": str(cutoff_day),
+            "replaced_rows": deleted,
+        }
+
+    except Exception as exc:
+        logger.error(f"Error rolling up price history: {exc}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 @shared_task(bind=True, max_retries=1)
 def cleanup_old_price_history(self) -> dict:
     """Clean up old price history entries beyond retention period.
@@ -295,13 +451,29 @@ def cleanup_old_price_history(self) -> dict:
         retention_days = celery_settings.price_history_retention_days
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-        # Delete old entries
-        deleted_count = (
-            db.query(PriceHistory)
-            .filter(PriceHistory.recorded_at < cutoff_date)
-            .delete()
-        )
-        db.commit()
+        # Delete in batches, committing each one, so a year-plus backlog
+        # never holds one giant write transaction. synchronize_session=False
+        # skips the ORM's session-state sweep — no expired entries are in
+        # this session. The id IN (SELECT ... LIMIT) shape bounds each
+        # batch; the recorded_at index keeps the inner select a range scan.
+        batch_size = 10_000
+        deleted_count = 0
+        while True:
+            batch_ids = (
+                select(PriceHistory.id)
+                .where(PriceHistory.recorded_at < cutoff_date)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            batch_deleted = (
+                db.query(PriceHistory)
+                .filter(PriceHistory.id.in_(batch_ids))
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            deleted_count += batch_deleted
+            if batch_deleted < batch_size:
+                break
 
         logger.info(
             f"Price history cleanup: deleted {deleted_count} entries "
@@ -340,32 +512,48 @@ def get_price_history_stats(
     try:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        query = db.query(PriceHistory).filter(
+        filters = [
             PriceHistory.product_id == product_id,
             PriceHistory.recorded_at >= cutoff_date,
-        )
-
+        ]
         if retailer:
-            query = query.filter(PriceHistory.retailer == retailer)
-
-        history = query.order_by(PriceHistory.recorded_at.desc()).all()
+            filters.append(PriceHistory.retailer == retailer)
+
+        # Aggregate in the database: one row of scalars comes back instead
+        # of every matching history entry, and the covering indexes answer
+        # it without touching the heap.
+        min_price, max_price, avg_price, data_points = (
+            db.query(
+                func.min(PriceHistory.price),
+                func.max(PriceHistory.price),
+                func.avg(PriceHistory.price),
+                func.count(PriceHistory.id),
+            )
+            .filter(*filters)
+            .one()
+        )
 
-        if not history:
+        if not data_points:
             return {"status": "success", "data": None}
 
-        prices = [h.price for h in history]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
-        current_price = prices[0] if prices else None
+        current_price = (
+            db.query(PriceHistory.price)
+            .filter(*filters)
+            .order_by(PriceHistory.recorded_at.desc())
+            .limit(1)
+            .scalar()
+        )
+        oldest_price = (
+            db.query(PriceHistory.price)
+            .filter(*filters)
+            .order_by(PriceHistory.recorded_at.asc())
+            .limit(1)
+            .scalar()
+        )
 
         # Calculate price change percentage
-        if len(prices) >= 2:
-            oldest_price = prices[-1]
-            if oldest_price > 0:
-                price_change_pct = ((current_price - oldest_price) / oldest_price) * 100
-            else:
-                price_change_pct = 0
+        if data_points >= 2 and oldest_price > 0:
+            price_change_pct = ((current_price - oldest_price) / oldest_price) * 100
         else:
             price_change_pct = 0
 
@@ -379,7 +567,7 @@ def get_price_history_stats(
                 "avg_price": round(avg_price, 2),
                 "current_price": current_price,
                 "price_change_pct": round(price_change_pct, 2),
-                "data_points": len(prices),
+                "data_points": data_points,
                 "days": days,
             },
         }
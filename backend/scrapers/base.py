@@ -11,6 +11,80 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+# Prefer lxml's C tokenizer: parsing dominates scraper CPU time for any
+# non-trivial page, and html.parser is pure Python. Fall back gracefully so
+# environments without the binary wheel still work.
+try:
+    import lxml  # noqa: F401
+
+    _SOUP_PARSER = "lxml"
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+
+# Constants for the normalization helpers, built once at import: the
+# helpers run per scraped product, and recompiling patterns or rebuilding
+# the brand/category literals on every call is pure overhead in that loop.
+_PRICE_NON_NUMERIC = re.compile(r"[^\d.,]")
+_ZIP_NON_DIGIT = re.compile(r"[^\d-]")
+
+# Common musical instrument brands, with lowercase forms precomputed for
+# matching.
+_KNOWN_BRANDS = tuple(
+    (brand, brand.lower())
+    for brand in (
+        "Fender", "Gibson", "Taylor", "Martin", "Yamaha", "Roland",
+        "Ibanez", "PRS", "Epiphone", "Squier", "Gretsch", "Jackson",
+        "ESP", "Schecter", "Rickenbacker", "Guild", "Takamine",
+        "Korg", "Boss", "Marshall", "Vox", "Mesa Boogie",
+        "Orange", "Line 6", "Blackstar", "Moog", "Nord",
+        "Pearl", "Zildjian", "DW", "Ludwig", "Tama", "Mapex",
+        "Shure", "Sennheiser", "Audio-Technica", "AKG", "Neumann",
+    )
+)
+
+# Category keywords, already lowercased to match the lowercased haystack.
+_CATEGORIES = {
+    category: tuple(keyword.lower() for keyword in keywords)
+    for category, keywords in {
+        "electric guitars": (
+            "electric guitar", "strat", "stratocaster", "telecaster",
+            "les paul", "sg ", "flying v", "explorer",
+        ),
+        "acoustic guitars": (
+            "acoustic guitar", "dreadnought", "concert guitar",
+            "parlor guitar", "classical guitar", "nylon string",
+        ),
+        "bass guitars": (
+            "bass guitar", "electric bass", "precision bass",
+            "jazz bass", "p-bass", "j-bass",
+        ),
+        "amplifiers": (
+            "amplifier", "amp ", "combo amp", "head amp",
+            "cabinet", "tube amp", "solid state",
+        ),
+        "effects pedals": (
+            "pedal", "effect", "overdrive", "distortion",
+            "reverb", "delay", "chorus", "phaser",
+        ),
+        "drums": (
+            "drum", "snare", "kick", "hi-hat", "cymbal",
+            "drum kit", "drum set", "percussion",
+        ),
+        "keyboards": (
+            "keyboard", "piano", "synthesizer", "synth",
+            "midi controller", "workstation",
+        ),
+        "microphones": (
+            "microphone", "mic ", "condenser", "dynamic mic",
+            "ribbon mic", "vocal mic",
+        ),
+        "accessories": (
+            "string", "pick", "strap", "case", "stand",
+            "tuner", "capo", "cable", "adapter",
+        ),
+    }.items()
+}
+
 
 @dataclass
 class ScraperConfig:
@@ -175,7 +249,9 @@ class BaseScraper(ABC):
         if response is None:
             return None
 
-        return BeautifulSoup(response.text, "html.parser")
+        # Pass raw bytes so lxml handles encoding detection itself instead
+        # of requests decoding to str first and the parser re-scanning it.
+        return BeautifulSoup(response.content, _SOUP_PARSER)
 
     def _normalize_price(self, price_str: str) -> Optional[float]:
         """Parse a price string into a float.
@@ -190,7 +266,7 @@ class BaseScraper(ABC):
             return None
 
         # Remove currency symbols and whitespace
-        cleaned = re.sub(r"[^\d.,]", "", price_str)
+        cleaned = _PRICE_NON_NUMERIC.sub("", price_str)
 
         # Handle European format (1.234,56) vs US format (1,234.56)
         if "," in cleaned and "." in cleaned:
@@ -279,7 +355,7 @@ class BaseScraper(ABC):
             location["state"] = state_clean[:2] if len(state_clean) > 2 else state_clean
         if zip_code:
             # Normalize US zip codes
-            zip_clean = re.sub(r"[^\d-]", "", zip_code)
+            zip_clean = _ZIP_NON_DIGIT.sub("", zip_code)
             location["zip_code"] = zip_clean[:10]
         if latitude is not None:
             location["latitude"] = latitude
@@ -302,23 +378,13 @@ class BaseScraper(ABC):
         if not name:
             return None
 
-        # Common musical instrument brands
-        known_brands = [
-            "Fender", "Gibson", "Taylor", "Martin", "Yamaha", "Roland",
-            "Ibanez", "PRS", "Epiphone", "Squier", "Gretsch", "Jackson",
-            "ESP", "Schecter", "Rickenbacker", "Guild", "Takamine",
-            "Korg", "Boss", "Marshall", "Vox", "Mesa Boogie",
-            "Orange", "Line 6", "Blackstar", "Moog", "Nord",
-            "Pearl", "Zildjian", "DW", "Ludwig", "Tama", "Mapex",
-            "Shure", "Sennheiser", "Audio-Technica", "AKG", "Neumann",
-        ]
-
         name_lower = name.lower()
+        padded_name = f" {name_lower} "
 
-        for brand in known_brands:
-            if name_lower.startswith(brand.lower()):
+        for brand, brand_lower in _KNOWN_BRANDS:
+            if name_lower.startswith(brand_lower):
                 return brand
-            if f" {brand.lower()} " in f" {name_lower} ":
+            if f" {brand_lower} " in padded_name:
                 return brand
 
         # Fall back to first word if it looks like a brand (capitalized)
@@ -340,46 +406,7 @@ class BaseScraper(ABC):
         """
         text = f"{name} {description}".lower()
 
-        categories = {
-            "electric guitars": [
-                "electric guitar", "strat", "stratocaster", "telecaster",
-                "les paul", "sg ", "flying v", "explorer",
-            ],
-            "acoustic guitars": [
-                "acoustic guitar", "dreadnought", "concert guitar",
-                "parlor guitar", "classical guitar", "nylon string",
-            ],
-            "bass guitars": [
-                "bass guitar", "electric bass", "precision bass",
-                "jazz bass", "p-bass", "j-bass",
-            ],
-            "amplifiers": [
-                "amplifier", "amp ", "combo amp", "head amp",
-                "cabinet", "tube amp", "solid state",
-            ],
-            "effects pedals": [
-                "pedal", "effect", "overdrive", "distortion",
-                "reverb", "delay", "chorus", "phaser",
-            ],
-            "drums": [
-                "drum", "snare", "kick", "hi-hat", "cymbal",
-                "drum kit", "drum set", "percussion",
-            ],
-            "keyboards": [
-                "keyboard", "piano", "synthesizer", "synth",
-                "midi controller", "workstation",
-            ],
-            "microphones": [
-                "microphone", "mic ", "condenser", "dynamic mic",
-                "ribbon mic", "vocal mic",
-            ],
-            "accessories": [
-                "string", "pick", "strap", "case", "stand",
-                "tuner", "capo", "cable", "adapter",
-            ],
-        }
-
-        for category, keywords in categories.items():
+        for category, keywords in _CATEGORIES.items():
             for keyword in keywords:
                 if keyword in text:
                     return category
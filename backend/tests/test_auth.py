@@ -69,3 +69,98 @@ def test_login_nonexistent_user(client):
     login_data = {"username": "nonexistent@example.com", "password": "password123"}
     response = client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 401
+
+
+def test_eddsa_signing_round_trip(monkeypatch):
+    """Test token signing and verification with an Ed25519 PEM secret."""
+    import importlib
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+    )
+
+    from app.core import security
+    from app.core.config import get_settings
+
+    pem = (
+        Ed25519PrivateKey.generate()
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+    # The algorithm is chosen at import time from the secret's format, so
+    # swap the secret and re-execute the module for the EdDSA path.
+    monkeypatch.setattr(get_settings(), "secret_key", pem)
+    importlib.reload(security)
+    try:
+        assert security._ALGO == "EdDSA"
+
+        token = security.create_access_token({"sub": "eddsa@example.com"})
+        payload = security.decode_access_token(token)
+        assert payload["sub"] == "eddsa@example.com"
+
+        # A tampered signature must not verify.
+        assert security.decode_access_token(token[:-2] + "xx") is None
+    finally:
+        monkeypatch.undo()
+        importlib.reload(security)
+
+    # A plain string secret keeps the configured HMAC algorithm.
+    assert security._ALGO == get_settings().algorithm
+
+
+def test_decode_access_token_caches_verified_tokens(monkeypatch):
+    """Test that repeat decodes of the same token skip signature checks."""
+    from app.core import security
+
+    security._token_cache.clear()
+    token = security.create_access_token({"sub": "token-cache@example.com"})
+
+    payload = security.decode_access_token(token)
+    assert payload["sub"] == "token-cache@example.com"
+    assert token in security._token_cache
+
+    # A cache hit must not reach PyJWT at all.
+    def unexpected_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode called on a cache hit")
+
+    monkeypatch.setattr(security.jwt, "decode", unexpected_decode)
+    assert security.decode_access_token(token) == payload
+
+    security._token_cache.clear()
+
+
+def test_decode_access_token_never_caches_failures():
+    """Test that invalid tokens are rejected and kept out of the cache."""
+    from app.core import security
+
+    security._token_cache.clear()
+    assert security.decode_access_token("not-a-token") is None
+    assert "not-a-token" not in security._token_cache
+
+
+def test_decode_access_token_cache_respects_token_exp():
+    """Test that a cached entry stops being served once the token expires."""
+    import time
+
+    from app.core import security
+
+    security._token_cache.clear()
+    token = security.create_access_token({"sub": "expiring@example.com"})
+
+    # Simulate a cached payload whose token exp has already passed; the
+    # stale entry must not be served, and full verification still applies.
+    security._token_cache[token] = (
+        {"sub": "expiring@example.com", "exp": time.time() - 1},
+        time.time() + security._TOKEN_CACHE_TTL,
+    )
+    payload = security.decode_access_token(token)
+    assert payload is not None
+    assert payload["exp"] > time.time()  # re-verified, not the stale entry
+
+    security._token_cache.clear()
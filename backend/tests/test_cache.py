@@ -0,0 +1,246 @@
+"""Tests for the Redis caching utilities."""
+
+import fnmatch
+
+from app.core.cache import cache_key, cached, clear_cache_pattern
+
+
+class FakePipeline:
+    """Buffers commands and replays them against the fake client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append(("setex", key, ttl, value))
+
+    def delete(self, *keys):
+        self.ops.append(("delete",) + keys)
+
+    def execute(self):
+        for op in self.ops:
+            getattr(self.client, op[0])(*op[1:])
+        self.ops = []
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis client used by cached()."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    def keys(self, pattern="*"):
+        return [key for key in self.store if fnmatch.fnmatch(key, pattern)]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+def test_cache_key_is_deterministic():
+    """Test that identical arguments hash to the same short key."""
+    assert cache_key("guitar", 1, limit=20) == cache_key("guitar", 1, limit=20)
+    # blake2b with digest_size=16 -> 32 hex chars regardless of input length
+    assert len(cache_key("x" * 10_000)) == 32
+
+
+def test_cache_key_kwarg_order_is_canonical():
+    """Test that kwarg ordering does not change the key."""
+    assert cache_key(page=1, limit=20) == cache_key(limit=20, page=1)
+
+
+def test_cache_key_skips_non_primitive_args():
+    """Test that sessions and other rich objects do not affect the key."""
+    assert cache_key(object(), "guitar") == cache_key("guitar")
+    assert cache_key("guitar", db=object()) == cache_key("guitar")
+
+
+def test_cache_key_distinguishes_different_args():
+    """Test that different arguments produce different keys."""
+    assert cache_key("guitar") != cache_key("piano")
+
+
+def test_cached_round_trip(monkeypatch):
+    """Test that a second call is served from the cache."""
+    fake = FakeRedis()
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    calls = []
+
+    @cached(ttl_seconds=60)
+    def compute(query):
+        calls.append(query)
+        return {"query": query, "total": 3}
+
+    first = compute("guitar")
+    second = compute("guitar")
+
+    assert first == {"query": "guitar", "total": 3}
+    assert second == first
+    assert calls == ["guitar"]  # second call never re-executed the function
+
+
+def test_cached_bypassed_without_redis(monkeypatch):
+    """Test that the decorator degrades to a plain call when Redis is down."""
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: None)
+
+    calls = []
+
+    @cached(ttl_seconds=60)
+    def compute(query):
+        calls.append(query)
+        return {"query": query}
+
+    compute("guitar")
+    compute("guitar")
+    assert calls == ["guitar", "guitar"]
+
+
+def test_clear_cache_pattern(monkeypatch):
+    """Test that pattern clearing removes only matching keys."""
+    fake = FakeRedis()
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    fake.store["search_products:abc"] = b"{}"
+    fake.store["search_products:def"] = b"{}"
+    fake.store["count_products:abc"] = b"{}"
+
+    clear_cache_pattern("search_products*")
+
+    assert set(fake.store) == {"count_products:abc"}
+
+
+class RefillingFakeRedis(FakeRedis):
+    """Simulates a lock-holding winner filling the key during the wait.
+
+    The first get() misses; the re-check after the lock wait returns the
+    value the "winner" stored in the meantime.
+    """
+
+    def __init__(self, key, value):
+        super().__init__()
+        self._fill_key = key
+        self._fill_value = value
+        self.get_calls = 0
+
+    def get(self, key):
+        self.get_calls += 1
+        if self.get_calls > 1 and key == self._fill_key:
+            return self._fill_value
+        return super().get(key)
+
+
+def test_cached_miss_takes_and_releases_lock(monkeypatch):
+    """Test that a miss computes under the refill lock and releases it."""
+    fake = FakeRedis()
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    @cached(ttl_seconds=60, key_builder=lambda query: query)
+    def compute(query):
+        # The lock must be held while the function body runs.
+        assert "compute:guitar:lock" in fake.store
+        return {"query": query}
+
+    compute("guitar")
+
+    assert "compute:guitar" in fake.store
+    assert "compute:guitar:lock" not in fake.store  # released with the fill
+
+
+def test_cached_stampede_loser_waits_for_winner(monkeypatch):
+    """Test that a concurrent miss re-checks the cache instead of recomputing."""
+    import orjson
+
+    fake = RefillingFakeRedis("compute:guitar", orjson.dumps({"query": "guitar"}))
+    # Another process already holds the refill lock.
+    fake.store["compute:guitar:lock"] = "1"
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    calls = []
+
+    @cached(ttl_seconds=60, key_builder=lambda query: query)
+    def compute(query):
+        calls.append(query)
+        return {"query": query}
+
+    result = compute("guitar")
+
+    assert result == {"query": "guitar"}
+    assert calls == []  # served from the winner's fill, never recomputed
+
+
+def test_cached_stampede_loser_computes_if_winner_is_slow(monkeypatch):
+    """Test that the loser falls through and computes when the re-check misses."""
+    fake = FakeRedis()
+    fake.store["compute:guitar:lock"] = "1"
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    calls = []
+
+    @cached(ttl_seconds=60, key_builder=lambda query: query)
+    def compute(query):
+        calls.append(query)
+        return {"query": query}
+
+    result = compute("guitar")
+
+    assert result == {"query": "guitar"}
+    assert calls == ["guitar"]  # did not block forever on the slow winner
+
+
+def test_alert_status_cache_is_keyed_per_user(client, monkeypatch):
+    """Test that cached alert statuses are never shared across users."""
+    fake = FakeRedis()
+    monkeypatch.setattr("app.core.cache.get_redis_client", lambda: fake)
+
+    def register_and_login(email):
+        client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "password": "testpassword123"},
+        )
+        response = client.post(
+            "/api/v1/auth/login",
+            data={"username": email, "password": "testpassword123"},
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    owner_headers = register_and_login("alert-owner@example.com")
+    other_headers = register_and_login("alert-other@example.com")
+
+    product_id = client.post(
+        "/api/v1/products", json={"name": "Alert Cache Key Product"}
+    ).json()["id"]
+    item = client.post(
+        "/api/v1/wishlist",
+        json={"product_id": product_id, "target_price": 50.0},
+        headers=owner_headers,
+    ).json()
+
+    response = client.get(
+        f"/api/v1/alerts/{item['id']}/status", headers=owner_headers
+    )
+    assert response.status_code == 200
+    assert f"get_alert_status:{item['user_id']}:{item['id']}" in fake.store
+
+    # A different user asking about the same item must miss the owner's
+    # cached entry and get their own 404, not the owner's status.
+    response = client.get(
+        f"/api/v1/alerts/{item['id']}/status", headers=other_headers
+    )
+    assert response.status_code == 404
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 
 class TestCeleryConfig:
@@ -15,7 +15,8 @@ class TestCeleryConfig:
         settings = CelerySettings()
         assert settings.broker_url == "redis://localhost:6379/0"
         assert settings.result_backend == "redis://localhost:6379/0"
-        assert settings.task_serializer == "json"
+        assert settings.task_serializer == "msgpack"
+        assert "json" in settings.accept_content
         assert settings.timezone == "UTC"
         assert settings.price_scrape_interval == 3600
         assert settings.alert_check_interval == 300
@@ -120,7 +121,15 @@ class TestCeleryTasks:
 
         mock_db = MagicMock()
         mock_session.return_value = mock_db
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+
+        # Both queries chain off db.query: the count scalar and the joined
+        # alert rows.
+        mock_query = MagicMock()
+        mock_db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.join.return_value = mock_query
+        mock_query.scalar.return_value = 0
+        mock_query.all.return_value = []
 
         result = check_price_alerts()
 
@@ -143,6 +152,82 @@ class TestCeleryTasks:
         assert result["deleted_count"] == 10
         mock_db.commit.assert_called_once()
 
+    def test_rollup_price_history_daily(self):
+        """Test rolling raw history up into per-day aggregates."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        from app.db.database import Base
+        from app.models.price_history import PriceHistory, PriceHistoryDaily
+        from app.models.product import Product
+        from celery_app.tasks import rollup_price_history_daily
+
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        # Pin all entries to noon today so the group never straddles a UTC
+        # midnight and the expected day is deterministic.
+        base = datetime.now(timezone.utc).replace(
+            hour=12, minute=0, second=0, microsecond=0
+        )
+        db = TestSession()
+        try:
+            db.add(Product(name="Rollup Product"))
+            db.commit()
+            for minutes_ago, retailer, price in (
+                (30, "Amazon", 100.0),
+                (20, "Amazon", 80.0),
+                (10, "Amazon", 90.0),
+                (20, "Sweetwater", 110.0),
+            ):
+                db.add(
+                    PriceHistory(
+                        product_id=1,
+                        retailer=retailer,
+                        price=price,
+                        currency="USD",
+                        recorded_at=base - timedelta(minutes=minutes_ago),
+                    )
+                )
+            db.commit()
+
+            with patch("celery_app.tasks.SessionLocal", TestSession):
+                result = rollup_price_history_daily.apply(
+                    kwargs={"days_back": 2}
+                ).get()
+
+            assert result["status"] == "success"
+
+            rows = {
+                row.retailer: row
+                for row in db.query(PriceHistoryDaily)
+                .filter(PriceHistoryDaily.product_id == 1)
+                .all()
+            }
+            assert set(rows) == {"Amazon", "Sweetwater"}
+
+            amazon = rows["Amazon"]
+            assert amazon.day == base.date()
+            assert amazon.min_price == 80.0
+            assert amazon.max_price == 100.0
+            assert round(amazon.avg_price, 2) == 90.0
+            assert amazon.count == 3
+            assert amazon.first_price == 100.0
+            assert amazon.last_price == 90.0
+
+            sweetwater = rows["Sweetwater"]
+            assert sweetwater.count == 1
+            assert sweetwater.first_price == 110.0
+            assert sweetwater.last_price == 110.0
+        finally:
+            db.close()
+
     @patch("celery_app.tasks.SessionLocal")
     def test_get_price_history_stats_no_data(self, mock_session):
         """Test getting price history stats with no data."""
@@ -155,8 +240,7 @@ class TestCeleryTasks:
         mock_query = MagicMock()
         mock_db.query.return_value = mock_query
         mock_query.filter.return_value = mock_query  # filter returns self
-        mock_query.order_by.return_value = mock_query  # order_by returns self
-        mock_query.all.return_value = []  # final result is empty
+        mock_query.one.return_value = (None, None, None, 0)  # empty aggregate
 
         result = get_price_history_stats(product_id=1, days=30)
 
@@ -168,14 +252,6 @@ class TestCeleryTasks:
         """Test getting price history stats with data."""
         from celery_app.tasks import get_price_history_stats
 
-        # Create mock history entries
-        mock_entry1 = MagicMock()
-        mock_entry1.price = 100.0
-        mock_entry2 = MagicMock()
-        mock_entry2.price = 120.0
-        mock_entry3 = MagicMock()
-        mock_entry3.price = 90.0
-
         mock_db = MagicMock()
         mock_session.return_value = mock_db
 
@@ -184,7 +260,9 @@ class TestCeleryTasks:
         mock_db.query.return_value = mock_query
         mock_query.filter.return_value = mock_query  # filter returns self
         mock_query.order_by.return_value = mock_query  # order_by returns self
-        mock_query.all.return_value = [mock_entry1, mock_entry2, mock_entry3]
+        mock_query.limit.return_value = mock_query  # limit returns self
+        mock_query.one.return_value = (90.0, 120.0, 103.333, 3)  # aggregate row
+        mock_query.scalar.side_effect = [100.0, 90.0]  # current, oldest
 
         result = get_price_history_stats(product_id=1, days=30)
 
@@ -193,3 +271,5 @@ class TestCeleryTasks:
         assert result["data"]["max_price"] == 120.0
         assert result["data"]["avg_price"] == 103.33
         assert result["data"]["data_points"] == 3
+        assert result["data"]["current_price"] == 100.0
+        assert result["data"]["price_change_pct"] == 11.11
@@ -98,3 +98,160 @@ def test_get_product_price_history_with_retailer_filter(client):
         f"/api/v1/wishlist/products/{product_id}/price-history?retailer=Amazon"
     )
     assert response.status_code == 200
+
+
+def test_get_price_history_stats_nonexistent(client):
+    """Test getting price stats for a nonexistent product."""
+    response = client.get("/api/v1/price-history/product/99999/stats")
+    assert response.status_code == 404
+
+
+def test_get_price_history_stats_empty(client):
+    """Test getting price stats for a product with no history."""
+    product_response = client.post(
+        "/api/v1/products", json={"name": "Stats Empty Product"}
+    )
+    product_id = product_response.json()["id"]
+
+    response = client.get(f"/api/v1/price-history/product/{product_id}/stats")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["product_id"] == product_id
+    assert data["min_price"] == 0.0
+    assert data["max_price"] == 0.0
+    assert data["avg_price"] == 0.0
+    assert data["total_records"] == 0
+    assert data["trend"] == "stable"
+
+
+def test_get_price_history_stats_with_history(client):
+    """Test price stats computed over seeded history entries."""
+    from app.models.price_history import PriceHistory
+    from tests.conftest import TestingSessionLocal
+
+    product_response = client.post(
+        "/api/v1/products", json={"name": "Stats History Product"}
+    )
+    product_id = product_response.json()["id"]
+
+    now = datetime.now(timezone.utc)
+    db = TestingSessionLocal()
+    try:
+        for hours_ago, price in ((3, 90.0), (2, 110.0), (1, 120.0)):
+            db.add(
+                PriceHistory(
+                    product_id=product_id,
+                    retailer="Amazon",
+                    price=price,
+                    currency="USD",
+                    recorded_at=now - timedelta(hours=hours_ago),
+                )
+            )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(f"/api/v1/price-history/product/{product_id}/stats")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["product_id"] == product_id
+    assert data["min_price"] == 90.0
+    assert data["max_price"] == 120.0
+    assert round(data["avg_price"], 2) == 106.67
+    assert data["current_price"] == 120.0
+    assert data["price_change"] == 30.0
+    assert data["price_change_pct"] == 33.33
+    assert data["trend"] == "increasing"
+    assert data["total_records"] == 3
+
+
+def test_chart_data_resamples_from_rollup_for_wide_windows(client):
+    """Test that charts over 7 days read the daily rollup, not raw rows."""
+    from app.models.price_history import PriceHistory, PriceHistoryDaily
+    from tests.conftest import TestingSessionLocal
+
+    product_response = client.post(
+        "/api/v1/products", json={"name": "Chart Rollup Product"}
+    )
+    product_id = product_response.json()["id"]
+
+    now = datetime.now(timezone.utc)
+    db = TestingSessionLocal()
+    try:
+        # Raw entries that must NOT appear in the wide-window chart.
+        for hours_ago, price in ((2, 100.0), (1, 110.0)):
+            db.add(
+                PriceHistory(
+                    product_id=product_id,
+                    retailer="Amazon",
+                    price=price,
+                    recorded_at=now - timedelta(hours=hours_ago),
+                )
+            )
+        # One rollup row per day.
+        for days_ago, avg_price in ((1, 105.0), (0, 95.0)):
+            db.add(
+                PriceHistoryDaily(
+                    product_id=product_id,
+                    day=(now - timedelta(days=days_ago)).date(),
+                    retailer="Amazon",
+                    min_price=avg_price - 5,
+                    max_price=avg_price + 5,
+                    avg_price=avg_price,
+                    count=4,
+                    first_price=avg_price - 5,
+                    last_price=avg_price + 5,
+                )
+            )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/v1/price-history/product/{product_id}/chart?days=30"
+    )
+    assert response.status_code == 200
+    points = response.json()["data_by_retailer"]["Amazon"]
+    assert [point["price"] for point in points] == [105.0, 95.0]
+
+    # Short windows keep raw intra-day points.
+    response = client.get(
+        f"/api/v1/price-history/product/{product_id}/chart?days=7"
+    )
+    points = response.json()["data_by_retailer"]["Amazon"]
+    assert [point["price"] for point in points] == [100.0, 110.0]
+
+
+def test_chart_data_falls_back_to_raw_when_rollup_empty(client):
+    """Test the raw-row fallback when the rollup has no rows in the window."""
+    from app.models.price_history import PriceHistory
+    from tests.conftest import TestingSessionLocal
+
+    product_response = client.post(
+        "/api/v1/products", json={"name": "Chart Fallback Product"}
+    )
+    product_id = product_response.json()["id"]
+
+    now = datetime.now(timezone.utc)
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            PriceHistory(
+                product_id=product_id,
+                retailer="Amazon",
+                price=120.0,
+                recorded_at=now - timedelta(hours=1),
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/v1/price-history/product/{product_id}/chart?days=30"
+    )
+    assert response.status_code == 200
+    points = response.json()["data_by_retailer"]["Amazon"]
+    assert [point["price"] for point in points] == [120.0]
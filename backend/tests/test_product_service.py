@@ -193,3 +193,43 @@ def test_product_service_get_products_by_brand(db_session):
 
     assert len(apple_products) >= 1
     assert all("Apple" in p.brand for p in apple_products)
+
+
+def test_product_service_add_prices_bulk(db_session):
+    """Test inserting many price entries in one statement."""
+    product = product_service.create_product(
+        db_session, ProductCreate(name="Bulk Price Product")
+    )
+
+    inserted = product_service.add_product_prices_bulk(
+        db_session,
+        [
+            {"product_id": product.id, "retailer": "Amazon", "price": 99.99},
+            {
+                "product_id": product.id,
+                "retailer": "Walmart",
+                "price": 89.99,
+                "url": "https://example.com/bulk",
+                "in_stock": False,
+            },
+            {"product_id": product.id, "retailer": "Target", "price": 94.99},
+        ],
+    )
+    assert inserted == 3
+
+    prices = {
+        price.retailer: price
+        for price in product_service.get_product_prices(db_session, product.id)
+    }
+    assert set(prices) == {"Amazon", "Walmart", "Target"}
+    assert prices["Walmart"].price == 89.99
+    assert prices["Walmart"].url == "https://example.com/bulk"
+    assert prices["Walmart"].in_stock is False
+    # Omitted columns fall back to their model defaults.
+    assert prices["Amazon"].currency == "USD"
+    assert prices["Amazon"].in_stock is True
+
+
+def test_product_service_add_prices_bulk_empty(db_session):
+    """Test that an empty batch is a no-op."""
+    assert product_service.add_product_prices_bulk(db_session, []) == 0
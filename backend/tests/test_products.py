@@ -145,3 +145,144 @@ def test_get_product_prices(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 3
+
+
+def test_create_product_duplicate_name(client):
+    """Test creating a product with a name that already exists."""
+    client.post("/api/v1/products", json={"name": "Duplicate Name Product"})
+
+    response = client.post(
+        "/api/v1/products", json={"name": "Duplicate Name Product"}
+    )
+    assert response.status_code == 409
+    assert "already exists" in response.json()["detail"]
+
+
+def test_update_product_duplicate_name(client):
+    """Test renaming a product onto an existing product's name."""
+    client.post("/api/v1/products", json={"name": "Rename Target Product"})
+    create_response = client.post(
+        "/api/v1/products", json={"name": "Rename Source Product"}
+    )
+    product_id = create_response.json()["id"]
+
+    response = client.put(
+        f"/api/v1/products/{product_id}",
+        json={"name": "Rename Target Product"},
+    )
+    assert response.status_code == 409
+
+
+def test_product_writes_invalidate_caches(client, monkeypatch):
+    """Test that product writes clear the product and search caches."""
+    calls = []
+    monkeypatch.setattr(
+        "app.api.routes.products.clear_product_cache",
+        lambda: calls.append("product"),
+    )
+    monkeypatch.setattr(
+        "app.api.routes.products.clear_search_cache",
+        lambda: calls.append("search"),
+    )
+
+    response = client.post(
+        "/api/v1/products", json={"name": "Cache Invalidation Product"}
+    )
+    assert response.status_code == 201
+    assert calls == ["product", "search"]
+
+    calls.clear()
+    product_id = response.json()["id"]
+    response = client.delete(f"/api/v1/products/{product_id}")
+    assert response.status_code == 204
+    assert calls == ["product", "search"]
+
+
+def test_products_summary(client):
+    """Test the lightweight summary listing."""
+    create_response = client.post(
+        "/api/v1/products",
+        json={
+            "name": "Summary Listing Product",
+            "brand": "Fender",
+            "category": "Electric Guitars",
+            "description": "Long description the summary must not carry.",
+        },
+    )
+    product_id = create_response.json()["id"]
+    for retailer, price, in_stock in (
+        ("Amazon", 799.99, True),
+        ("Walmart", 749.99, True),
+        ("Target", 699.99, False),
+    ):
+        client.post(
+            f"/api/v1/products/{product_id}/prices",
+            json={
+                "product_id": product_id,
+                "retailer": retailer,
+                "price": price,
+                "in_stock": in_stock,
+            },
+        )
+
+    response = client.get("/api/v1/products/summary")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+
+    summary = data[0]
+    assert summary["id"] == product_id
+    assert summary["name"] == "Summary Listing Product"
+    assert summary["brand"] == "Fender"
+    assert summary["category"] == "Electric Guitars"
+    # Lowest *in-stock* price; the cheaper out-of-stock row must not win.
+    assert summary["lowest_price"] == 749.99
+    assert "description" not in summary
+    assert "prices" not in summary
+
+
+def test_products_summary_filters_and_no_prices(client):
+    """Test summary filtering and the no-in-stock-price case."""
+    client.post(
+        "/api/v1/products",
+        json={"name": "Summary Keyboard", "brand": "Korg", "category": "Keyboards"},
+    )
+    client.post(
+        "/api/v1/products",
+        json={"name": "Summary Drum Kit", "brand": "Pearl", "category": "Drums"},
+    )
+
+    response = client.get("/api/v1/products/summary?category=Keyboards")
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data] == ["Summary Keyboard"]
+    assert data[0]["lowest_price"] is None
+
+    response = client.get("/api/v1/products/summary?brand=Pearl")
+    assert [item["name"] for item in response.json()] == ["Summary Drum Kit"]
+
+
+def test_list_products_keyset_cursor(client):
+    """Test keyset pagination on the product listing."""
+    for i in range(5):
+        client.post("/api/v1/products", json={"name": f"Cursor Product {i}"})
+
+    first_page = client.get("/api/v1/products?limit=2").json()
+    assert len(first_page) == 2
+
+    # Pass the last id of the previous page; the next page starts after it.
+    cursor = first_page[-1]["id"]
+    second_page = client.get(f"/api/v1/products?cursor={cursor}&limit=2").json()
+    assert len(second_page) == 2
+    assert all(item["id"] > cursor for item in second_page)
+    assert second_page == client.get("/api/v1/products?page=2&limit=2").json()
+
+    # Cursor takes precedence over page.
+    with_page = client.get(
+        f"/api/v1/products?cursor={cursor}&page=3&limit=2"
+    ).json()
+    assert with_page == second_page
+
+    # Walking past the end yields an empty page.
+    last_cursor = client.get(f"/api/v1/products?cursor={cursor}&limit=10").json()[-1]["id"]
+    assert client.get(f"/api/v1/products?cursor={last_cursor}").json() == []
@@ -236,3 +236,68 @@ def test_search_empty_results(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0
+
+
+def test_stream_search_products_ndjson(client):
+    """Test streaming search results as NDJSON."""
+    import json
+
+    names = ["NDJSON Snare Drum", "NDJSON Drum Kit", "NDJSON Hi-Hat"]
+    for name in names:
+        client.post(
+            "/api/v1/products", json={"name": name, "category": "Drums"}
+        )
+
+    response = client.get("/api/v1/search/products.ndjson?category=Drums")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    assert sorted(row["name"] for row in rows) == sorted(names)
+    # One complete product object per line, same shape as the list endpoint.
+    assert {"id", "name", "category"} <= set(rows[0])
+
+
+def test_stream_search_products_ndjson_respects_limit(client):
+    """Test that the NDJSON stream caps rows at the limit parameter."""
+    import json
+
+    for i in range(3):
+        client.post("/api/v1/products", json={"name": f"NDJSON Limit {i}"})
+
+    response = client.get("/api/v1/search/products.ndjson?limit=2")
+    assert response.status_code == 200
+
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(rows) == 2
+
+
+def test_search_deals_keyset_cursor(client):
+    """Test keyset pagination on the deals listing."""
+    prices = {"Deal A": 30.0, "Deal B": 10.0, "Deal C": 20.0, "Deal D": 40.0}
+    for name, price in prices.items():
+        product_id = client.post(
+            "/api/v1/products", json={"name": name}
+        ).json()["id"]
+        client.post(
+            f"/api/v1/products/{product_id}/prices",
+            json={"product_id": product_id, "retailer": "Amazon", "price": price},
+        )
+
+    first_page = client.get("/api/v1/search/deals?limit=2").json()
+    assert [item["name"] for item in first_page] == ["Deal B", "Deal C"]
+
+    # Cursor is '<min_price>:<id>' of the last product on the page.
+    last = first_page[-1]
+    cursor = f"{prices[last['name']]}:{last['id']}"
+    second_page = client.get(f"/api/v1/search/deals?cursor={cursor}&limit=2").json()
+    assert [item["name"] for item in second_page] == ["Deal A", "Deal D"]
+    assert second_page == client.get("/api/v1/search/deals?page=2&limit=2").json()
+
+
+def test_search_deals_malformed_cursor(client):
+    """Test that a malformed deals cursor is rejected with a 400."""
+    for cursor in ("not-a-cursor", "12.5", "abc:def"):
+        response = client.get(f"/api/v1/search/deals?cursor={cursor}")
+        assert response.status_code == 400
+        assert "cursor" in response.json()["detail"].lower()